@@ -9,15 +9,15 @@ import difflib
 import logging
 import types
 from enum import Enum
-from copy import deepcopy
+from copy import copy
 from math import isclose as is_close
 from typing import List, Dict, IO, Callable, Set, Union, Any, Pattern, Tuple, Optional
-from collections.abc import Mapping, Iterable, Sequence
+from collections.abc import Mapping, Iterable, Sequence, Sized
 from collections import defaultdict
 from inspect import getmembers
 from itertools import zip_longest
 from deepdiff.helper import (strings, bytes_type, numbers, uuids, datetimes, ListItemRemovedOrAdded, notpresent,
-                             IndexedHash, unprocessed, add_to_frozen_set, basic_types,
+                             IndexedHash, unprocessed, basic_types,
                              convert_item_or_items_into_set_else_none, get_type,
                              convert_item_or_items_into_compiled_regexes_else_none,
                              type_is_subclass_of_type_group, type_in_type_group, get_doc,
@@ -25,7 +25,8 @@ from deepdiff.helper import (strings, bytes_type, numbers, uuids, datetimes, Lis
                              np_ndarray, np_floating, get_numpy_ndarray_rows, RepeatedTimer,
                              TEXT_VIEW, TREE_VIEW, DELTA_VIEW, detailed__dict__, add_root_to_paths,
                              np, get_truncate_datetime, dict_, CannotCompare, ENUM_INCLUDE_KEYS,
-                             PydanticBaseModel, Opcode, SetOrdered)
+                             PydanticBaseModel, Opcode, SetOrdered, compile_regexes_union,
+                             dir_depends_on_class_only, get_class_level_dir, isinstance_depends_on_class_only)
 from deepdiff.serialization import SerializationMixin
 from deepdiff.distance import DistanceMixin, logarithmic_similarity
 from deepdiff.model import (
@@ -38,6 +39,13 @@ from deepdiff.model import (
 from deepdiff.deephash import DeepHash, combine_hashes_lists
 from deepdiff.base import Base
 from deepdiff.lfucache import LFUCache, DummyLFU
+from deepdiff.operator import BaseOperator
+
+try:
+    # cdifflib is a C implementation of difflib.SequenceMatcher that produces the same opcodes.
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:  # pragma: no cover.
+    from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +87,28 @@ CUTOFF_RANGE_ERROR_MSG = 'cutoff_distance_for_pairs needs to be a positive float
 VERBOSE_LEVEL_RANGE_MSG = 'verbose_level should be 0, 1, or 2.'
 PURGE_LEVEL_RANGE_MSG = 'cache_purge_level should be 0, 1, or 2.'
 _ENABLE_CACHE_EVERY_X_DIFF = '_ENABLE_CACHE_EVERY_X_DIFF'
+_STATS_TEMPLATE = {
+    PASSES_COUNT: 0,
+    DIFF_COUNT: 0,
+    DISTANCE_CACHE_HIT_COUNT: 0,
+    PREVIOUS_DIFF_COUNT: 0,
+    PREVIOUS_DISTANCE_CACHE_HIT_COUNT: 0,
+    MAX_PASS_LIMIT_REACHED: False,
+    MAX_DIFF_LIMIT_REACHED: False,
+    DISTANCE_CACHE_ENABLED: False,
+}
+# The diff methods that only take the level and the local_tree.
+_DIFF_METHODS_WITHOUT_PARENTS_IDS = frozenset((
+    '_diff_booleans', '_diff_str', '_diff_datetimes', '_diff_uuids', '_diff_set',
+))
+# The most common sequences. Checking the exact class is much faster than isinstance with the Sequence ABC.
+_BUILTIN_SEQUENCE_TYPES = (list, tuple)
+# Numpy dtype kinds (bool, signed int, unsigned int, float, complex) that can be compared element-wise with numpy.
+NUMPY_NUMERIC_DTYPE_KINDS = frozenset('biufc')
+# Numpy dtype kinds (bool, signed int, unsigned int) that only hold whole numbers.
+NUMPY_INTEGER_DTYPE_KINDS = frozenset('biu')
+# Numpy dtype kinds whose items always compare equal to themselves, unlike floats, complex numbers and NaT.
+NUMPY_SELF_EQUAL_DTYPE_KINDS = frozenset('biuSU')
 
 # What is the threshold to consider 2 items to be pairs. Only used when ignore_order = True.
 CUTOFF_DISTANCE_FOR_PAIRS_DEFAULT = 0.3
@@ -280,16 +310,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             self.is_root = True
             # Caching the DeepDiff results for dynamic programming
             self._distance_cache = LFUCache(cache_size) if cache_size else DummyLFU()
-            self._stats = {
-                PASSES_COUNT: 0,
-                DIFF_COUNT: 0,
-                DISTANCE_CACHE_HIT_COUNT: 0,
-                PREVIOUS_DIFF_COUNT: 0,
-                PREVIOUS_DISTANCE_CACHE_HIT_COUNT: 0,
-                MAX_PASS_LIMIT_REACHED: False,
-                MAX_DIFF_LIMIT_REACHED: False,
-                DISTANCE_CACHE_ENABLED: bool(cache_size),
-            }
+            self._stats = _STATS_TEMPLATE.copy()
+            self._stats[DISTANCE_CACHE_ENABLED] = bool(cache_size)
             self.hashes = dict_() if hashes is None else hashes
             self._numpy_paths = dict_()  # if _numpy_paths is None else _numpy_paths
             self._shared_parameters = {
@@ -306,7 +328,56 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 progress_timer = None
 
         self._parameters = _parameters
-        self.deephash_parameters = self._get_deephash_params()
+        if 'deephash_parameters' not in _parameters:
+            # The parameters that are derived from the other parameters are calculated once and then passed on
+            # to the other passes along with the rest of the _parameters.
+            # When none of the exclusion/inclusion options are set, _skip_this can return early
+            # without building the path of the level.
+            self._has_any_exclusions = any((
+                self.exclude_paths, self.include_paths, self.exclude_regex_paths, self.exclude_types_tuple,
+                self.exclude_obj_callback, self.exclude_obj_callback_strict,
+                self.include_obj_callback, self.include_obj_callback_strict,
+            ))
+            # The exclude_regex_paths combined into one regex so that each path is searched only once.
+            self._exclude_regex_union = compile_regexes_union(self.exclude_regex_paths)
+            # Whether _count_diff needs to auto tune the cache.
+            self._auto_tune_cache_enabled = bool(self.cache_size and self.cache_tuning_sample_size)
+            self.deephash_parameters = self._get_deephash_params()
+            # Whether the type change between 2 types is ignored by ignore_type_in_groups.
+            # The dictionary itself is shared by all the passes.
+            self._type_group_cache = {}
+            # The decision can only be cached when the isinstance checks against the type groups
+            # depend on the classes of the objects alone.
+            self._type_group_cache_enabled = self.ignore_type_subclasses or all(
+                isinstance_depends_on_class_only(type_)
+                for type_group in self.ignore_type_in_groups for type_ in type_group
+            )
+            # The custom operators that need to be checked for the types of t1 and t2.
+            # The dictionary itself is shared by all the passes.
+            self._custom_operators_cache = {}
+            # The name of the method that diffs the objects of each class.
+            # It is only kept for one diff since the isinstance checks against the ABCs can change
+            # when classes are registered with them.
+            self._diff_method_cache = {}
+            # The names that come from dir() of the classes of the objects.
+            # It is only kept for one diff since the names change when attributes are set on a class.
+            self._class_dir_cache = {}
+            # The (slot name, unmangled attribute name) pairs of the classes of the objects.
+            self._class_slots_cache = {}
+            # The _parameters are shared by all the passes, so they are made read-only.
+            self._parameters = types.MappingProxyType({
+                **_parameters,
+                '_has_any_exclusions': self._has_any_exclusions,
+                '_exclude_regex_union': self._exclude_regex_union,
+                '_auto_tune_cache_enabled': self._auto_tune_cache_enabled,
+                'deephash_parameters': self.deephash_parameters,
+                '_type_group_cache': self._type_group_cache,
+                '_type_group_cache_enabled': self._type_group_cache_enabled,
+                '_custom_operators_cache': self._custom_operators_cache,
+                '_diff_method_cache': self._diff_method_cache,
+                '_class_dir_cache': self._class_dir_cache,
+                '_class_slots_cache': self._class_slots_cache,
+            })
         self.tree = TreeResult()
         self._iterable_opcodes = {}
         if group_by and self.is_root:
@@ -326,10 +397,13 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
 
         try:
             root = DiffLevel(t1, t2, verbose_level=self.verbose_level)
+            # The ids of the objects on the path from the root to the current level. It is added to before diffing
+            # deeper and the id is discarded on the way back up, hence it is not a frozenset.
+            parents_ids = {id(t1)}
             # _original_type is only used to pass the original type of the data. Currently only used for numpy arrays.
             # The reason is that we convert the numpy array to python list and then later for distance calculations
             # we convert only the the last dimension of it into numpy arrays.
-            self._diff(root, parents_ids=frozenset({id(t1)}), _original_type=_original_type)
+            self._diff(root, parents_ids=parents_ids, _original_type=_original_type)
 
             if get_deep_distance and view in {TEXT_VIEW, TREE_VIEW}:
                 self.tree['deep_distance'] = self._get_rough_distance()
@@ -344,6 +418,12 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                     del self.hashes
                 del self._shared_parameters
                 del self._parameters
+                # The caches of the derived parameters are only needed while diffing.
+                del self._type_group_cache
+                del self._custom_operators_cache
+                del self._diff_method_cache
+                del self._class_dir_cache
+                del self._class_slots_cache
                 for key in (PREVIOUS_DIFF_COUNT, PREVIOUS_DISTANCE_CACHE_HIT_COUNT,
                             DISTANCE_CACHE_ENABLED):
                     del self._stats[key]
@@ -396,8 +476,7 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             level.additional[CUSTOM_FIELD] = extra_info
             self.tree[report_type].add(level)
 
-    @staticmethod
-    def _dict_from_slots(object):
+    def _dict_from_slots(self, object):
         def unmangle(attribute):
             if attribute.startswith('__') and attribute != '__weakref__':
                 return '_{type}{attribute}'.format(
@@ -406,24 +485,54 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 )
             return attribute
 
-        all_slots = []
+        is_type = isinstance(object, type)
+        # The (slot name, unmangled attribute name) pairs only depend on the class of the object.
+        slot_names = None if is_type else self._class_slots_cache.get(object.__class__)
 
-        if isinstance(object, type):
-            mro = object.__mro__  # pragma: no cover. I have not been able to write a test for this case. But we still check for it.
-        else:
-            mro = object.__class__.__mro__
+        if slot_names is None:
+            all_slots = []
 
-        for type_in_mro in mro:
-            slots = getattr(type_in_mro, '__slots__', None)
-            if slots:
-                if isinstance(slots, strings):
-                    all_slots.append(slots)
-                else:
-                    all_slots.extend(slots)
+            if is_type:
+                # I have not been able to write a test for this case. But we still check for it.
+                mro = object.__mro__  # pragma: no cover.
+            else:
+                mro = object.__class__.__mro__
+
+            for type_in_mro in mro:
+                slots = getattr(type_in_mro, '__slots__', None)
+                if slots:
+                    if isinstance(slots, strings):
+                        all_slots.append(slots)
+                    else:
+                        all_slots.extend(slots)
+
+            slot_names = tuple((i, unmangle(i)) for i in all_slots)
+            if not is_type:
+                self._class_slots_cache[object.__class__] = slot_names
 
-        return {i: getattr(object, unmangle(i)) for i in all_slots}
+        return {slot: getattr(object, attribute) for slot, attribute in slot_names}
 
-    def _diff_enum(self, level, parents_ids=frozenset(), local_tree=None):
+    def _dict_from_members(self, obj):
+        """
+        Get the non-callable members of an object that has neither __dict__ nor __slots__.
+        The attribute names are looked up once per class in a diff unless the object customizes dir().
+        """
+        if not dir_depends_on_class_only(obj):
+            return {k: v for k, v in getmembers(obj) if not callable(v)}
+        result = {}
+        # Without a __dict__ all the names in dir(obj) come from the class.
+        for name in get_class_level_dir(obj, self._class_dir_cache):
+            try:
+                value = getattr(obj, name)
+            except AttributeError:
+                continue
+            if not callable(value):
+                result[name] = value
+        return result
+
+    def _diff_enum(self, level, parents_ids=None, local_tree=None):
+        if parents_ids is None:
+            parents_ids = set()
         t1 = detailed__dict__(level.t1, include_keys=ENUM_INCLUDE_KEYS)
         t2 = detailed__dict__(level.t2, include_keys=ENUM_INCLUDE_KEYS)
 
@@ -437,22 +546,33 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             local_tree=local_tree,
         )
 
-    def _diff_obj(self, level, parents_ids=frozenset(), is_namedtuple=False, local_tree=None):
+    def _has_dir_entry(self, obj, name):
+        """
+        Whether __dict__ or __slots__ is in dir(obj).
+        For regular objects they come from the class, so the cached names of the class are enough.
+        """
+        return name in get_class_level_dir(obj, self._class_dir_cache)
+
+    def _diff_obj(self, level, parents_ids=None, is_namedtuple=False, local_tree=None):
         """Difference of 2 objects"""
+        if parents_ids is None:
+            parents_ids = set()
         processing_error = False
         try:
             if is_namedtuple:
                 t1 = level.t1._asdict()
                 t2 = level.t2._asdict()
-            elif all('__dict__' in dir(t) for t in level):
-                t1 = detailed__dict__(level.t1, ignore_private_variables=self.ignore_private_variables)
-                t2 = detailed__dict__(level.t2, ignore_private_variables=self.ignore_private_variables)
-            elif all('__slots__' in dir(t) for t in level):
+            elif self._has_dir_entry(level.t1, '__dict__') and self._has_dir_entry(level.t2, '__dict__'):
+                t1 = detailed__dict__(
+                    level.t1, ignore_private_variables=self.ignore_private_variables, dir_cache=self._class_dir_cache)
+                t2 = detailed__dict__(
+                    level.t2, ignore_private_variables=self.ignore_private_variables, dir_cache=self._class_dir_cache)
+            elif self._has_dir_entry(level.t1, '__slots__') and self._has_dir_entry(level.t2, '__slots__'):
                 t1 = self._dict_from_slots(level.t1)
                 t2 = self._dict_from_slots(level.t2)
             else:
-                t1 = {k: v for k, v in getmembers(level.t1) if not callable(v)}
-                t2 = {k: v for k, v in getmembers(level.t2) if not callable(v)}
+                t1 = self._dict_from_members(level.t1)
+                t2 = self._dict_from_members(level.t2)
         except AttributeError:
             processing_error = True
         if processing_error is True:
@@ -474,49 +594,81 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         Check whether this comparison should be skipped because one of the objects to compare meets exclusion criteria.
         :rtype: bool
         """
-        level_path = level.path()
-        skip = False
-        if self.exclude_paths and level_path in self.exclude_paths:
-            skip = True
-        if self.include_paths and level_path != 'root':
-            if level_path not in self.include_paths:
-                skip = True
-                for prefix in self.include_paths:
+        if not self._has_any_exclusions:
+            return False
+        return self._skip_this_path(level.path(), level.t1, level.t2)
+
+    def _skip_this_path(self, level_path, t1, t2):
+        """
+        Check whether a comparison at level_path between t1 and t2 should be skipped.
+        :rtype: bool
+        """
+        # Only an include_paths or include_obj_callback match can undo an exclude_paths match.
+        # All the other checks return as soon as their outcome is final.
+        exclude_paths = self.exclude_paths
+        include_paths = self.include_paths
+        skip = bool(exclude_paths) and level_path in exclude_paths
+        if include_paths and level_path != 'root':
+            if level_path not in include_paths:
+                for prefix in include_paths:
                     if prefix in level_path or level_path in prefix:
-                        skip = False
-                        break
-        elif self.exclude_regex_paths and any(
-                [exclude_regex_path.search(level_path) for exclude_regex_path in self.exclude_regex_paths]):
-            skip = True
-        elif self.exclude_types_tuple and \
-                (isinstance(level.t1, self.exclude_types_tuple) or isinstance(level.t2, self.exclude_types_tuple)):
-            skip = True
-        elif self.exclude_obj_callback and \
-                (self.exclude_obj_callback(level.t1, level_path) or self.exclude_obj_callback(level.t2, level_path)):
-            skip = True
-        elif self.exclude_obj_callback_strict and \
-                (self.exclude_obj_callback_strict(level.t1, level_path) and
-                 self.exclude_obj_callback_strict(level.t2, level_path)):
-            skip = True
-        elif self.include_obj_callback and level_path != 'root':
-            skip = True
-            if (self.include_obj_callback(level.t1, level_path) or self.include_obj_callback(level.t2, level_path)):
-                skip = False
-        elif self.include_obj_callback_strict and level_path != 'root':
-            skip = True
-            if (self.include_obj_callback_strict(level.t1, level_path) and
-                    self.include_obj_callback_strict(level.t2, level_path)):
-                skip = False
+                        return False
+                return True
+            return skip
+        exclude_regex_paths = self.exclude_regex_paths
+        if exclude_regex_paths:
+            exclude_regex_union = self._exclude_regex_union
+            if (exclude_regex_union.search(level_path) if exclude_regex_union is not None
+                    else any(exclude_regex_path.search(level_path) for exclude_regex_path in exclude_regex_paths)):
+                return True
+        exclude_types_tuple = self.exclude_types_tuple
+        if exclude_types_tuple and (isinstance(t1, exclude_types_tuple) or isinstance(t2, exclude_types_tuple)):
+            return True
+        callback = self.exclude_obj_callback
+        if callback and (callback(t1, level_path) or callback(t2, level_path)):
+            return True
+        callback = self.exclude_obj_callback_strict
+        if callback and callback(t1, level_path) and callback(t2, level_path):
+            return True
+        if level_path != 'root':
+            callback = self.include_obj_callback
+            if callback:
+                return not (callback(t1, level_path) or callback(t2, level_path))
+            callback = self.include_obj_callback_strict
+            if callback:
+                return not (callback(t1, level_path) and callback(t2, level_path))
 
         return skip
 
+    def _skip_dict_child(self, level, rel_class, key, t1, t2):
+        """
+        Check whether the child of a dictionary level is going to be skipped without creating its level.
+        Only used when no object callbacks are set, since those should be called once per object.
+        :rtype: bool
+        """
+        parent_path = level.path()
+        if parent_path is None:
+            return False
+        param_repr = rel_class(None, None, key).get_param_repr()
+        if not param_repr:
+            return False
+        return self._skip_this_path(parent_path + param_repr, t1, t2)
+
     def _get_clean_to_keys_mapping(self, keys, level):
         """
         Get a dictionary of cleaned value of keys to the keys themselves.
         This is mainly used to transform the keys when the type changes of keys should be ignored.
 
         TODO: needs also some key conversion for groups of types other than the built-in strings and numbers.
+
+        Returns None if none of the keys need to be cleaned.
         """
+        ignore_string_case = self.ignore_string_case
+        for key in keys:
+            if key.__class__ is not str or (ignore_string_case and key != key.lower()):
+                break
+        else:
+            return None
         result = dict_()
         for key in keys:
             if self.ignore_string_type_changes and isinstance(key, bytes):
@@ -543,7 +695,7 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
     def _diff_dict(
         self,
         level,
-        parents_ids=frozenset([]),
+        parents_ids=None,
         print_as_attribute=False,
         override=False,
         override_t1=None,
@@ -551,6 +703,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         local_tree=None,
     ):
         """Difference of 2 dictionaries"""
+        if parents_ids is None:
+            parents_ids = set()
         if override:
             # for special stuff like custom objects and named tuples we receive preprocessed t1 and t2
             # but must not spoil the chain (=level) with it
@@ -560,6 +714,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             t1 = level.t1
             t2 = level.t2
 
+        # Identical objects are already skipped by _diff, but the dictionaries can be empty on both sides.
+        if not t1 and not t2:
+            return
+
         if print_as_attribute:
             item_added_key = "attribute_added"
             item_removed_key = "attribute_removed"
@@ -569,106 +727,109 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             item_removed_key = "dictionary_item_removed"
             rel_class = DictRelationship
 
+        # Dictionaries keep the insertion order of their keys and have constant time membership checks,
+        # so they are used here as ordered sets of the keys.
         if self.ignore_private_variables:
-            t1_keys = SetOrdered([key for key in t1 if not(isinstance(key, str) and key.startswith('__'))])
-            t2_keys = SetOrdered([key for key in t2 if not(isinstance(key, str) and key.startswith('__'))])
+            t1_keys = {key: None for key in t1 if not(isinstance(key, str) and key.startswith('__'))}
+            t2_keys = {key: None for key in t2 if not(isinstance(key, str) and key.startswith('__'))}
         else:
-            t1_keys = SetOrdered(t1.keys())
-            t2_keys = SetOrdered(t2.keys())
+            t1_keys = t1.keys()
+            t2_keys = t2.keys()
         if self.ignore_string_type_changes or self.ignore_numeric_type_changes or self.ignore_string_case:
             t1_clean_to_keys = self._get_clean_to_keys_mapping(keys=t1_keys, level=level)
             t2_clean_to_keys = self._get_clean_to_keys_mapping(keys=t2_keys, level=level)
-            t1_keys = SetOrdered(t1_clean_to_keys.keys())
-            t2_keys = SetOrdered(t2_clean_to_keys.keys())
+            if t1_clean_to_keys is not None:
+                t1_keys = t1_clean_to_keys
+            if t2_clean_to_keys is not None:
+                t2_keys = t2_clean_to_keys
         else:
             t1_clean_to_keys = t2_clean_to_keys = None
 
-        t_keys_intersect = t2_keys & t1_keys
-        t_keys_union = t2_keys | t1_keys
-        t_keys_added = t2_keys - t_keys_intersect
-        t_keys_removed = t1_keys - t_keys_intersect
+        t_keys_intersect = [key for key in t2_keys if key in t1_keys]
+        # The added and removed keys are not materialized. They are found by iterating over the keys of each side
+        # and only when there are any.
+        has_added_keys = len(t2_keys) > len(t_keys_intersect)
+        has_removed_keys = len(t1_keys) > len(t_keys_intersect)
         if self.threshold_to_diff_deeper:
-            if len(t_keys_union) > 1 and len(t_keys_intersect) / len(t_keys_union) < self.threshold_to_diff_deeper:
+            t_keys_union_len = len(t2_keys) + len(t1_keys) - len(t_keys_intersect)
+            if t_keys_union_len > 1 and len(t_keys_intersect) / t_keys_union_len < self.threshold_to_diff_deeper:
                 self._report_result('values_changed', level, local_tree=local_tree)
                 return
 
-        for key in t_keys_added:
-            if self._count_diff() is StopIteration:
+        # When the children can be skipped only based on their path and type, check that before creating their levels.
+        skip_children_early = self._has_any_exclusions and not (
+            self.exclude_obj_callback or self.exclude_obj_callback_strict or
+            self.include_obj_callback or self.include_obj_callback_strict)
+
+        # Bound methods used in the loops below
+        count_diff = self._count_diff
+        branch_deeper = level.branch_deeper
+        report_result = self._report_result
+
+        for key in (t2_keys if has_added_keys else ()):
+            if key in t1_keys:
+                continue
+            if count_diff() is StopIteration:
                 return
 
             key = t2_clean_to_keys[key] if t2_clean_to_keys else key
-            change_level = level.branch_deeper(
-                notpresent,
-                t2[key],
-                child_relationship_class=rel_class,
-                child_relationship_param=key,
-                child_relationship_param2=key,
-            )
-            self._report_result(item_added_key, change_level, local_tree=local_tree)
+            if skip_children_early and self._skip_dict_child(level, rel_class, key, notpresent, t2[key]):
+                continue
+            change_level = branch_deeper(notpresent, t2[key], rel_class, key, key)
+            report_result(item_added_key, change_level, local_tree=local_tree)
 
-        for key in t_keys_removed:
-            if self._count_diff() is StopIteration:
+        for key in (t1_keys if has_removed_keys else ()):
+            if key in t2_keys:
+                continue
+            if count_diff() is StopIteration:
                 return  # pragma: no cover. This is already covered for addition.
 
             key = t1_clean_to_keys[key] if t1_clean_to_keys else key
-            change_level = level.branch_deeper(
-                t1[key],
-                notpresent,
-                child_relationship_class=rel_class,
-                child_relationship_param=key,
-                child_relationship_param2=key,
-            )
-            self._report_result(item_removed_key, change_level, local_tree=local_tree)
+            if skip_children_early and self._skip_dict_child(level, rel_class, key, t1[key], notpresent):
+                continue
+            change_level = branch_deeper(t1[key], notpresent, rel_class, key, key)
+            report_result(item_removed_key, change_level, local_tree=local_tree)
 
+        diff = self._diff
         for key in t_keys_intersect:  # key present in both dicts - need to compare values
-            if self._count_diff() is StopIteration:
+            if count_diff() is StopIteration:
                 return  # pragma: no cover. This is already covered for addition.
 
             key1 = t1_clean_to_keys[key] if t1_clean_to_keys else key
             key2 = t2_clean_to_keys[key] if t2_clean_to_keys else key
-            item_id = id(t1[key1])
+            t1_value = t1[key1]
+            item_id = id(t1_value)
             if parents_ids and item_id in parents_ids:
                 continue
-            parents_ids_added = add_to_frozen_set(parents_ids, item_id)
 
             # Go one level deeper
-            next_level = level.branch_deeper(
-                t1[key1],
-                t2[key2],
-                child_relationship_class=rel_class,
-                child_relationship_param=key,
-                child_relationship_param2=key,
-                )
-            self._diff(next_level, parents_ids_added, local_tree=local_tree)
+            next_level = branch_deeper(t1_value, t2[key2], rel_class, key, key)
+            parents_ids.add(item_id)
+            try:
+                diff(next_level, parents_ids, local_tree=local_tree)
+            finally:
+                parents_ids.discard(item_id)
 
     def _diff_set(self, level, local_tree=None):
         """Difference of sets"""
         t1_hashtable = self._create_hashtable(level, 't1')
         t2_hashtable = self._create_hashtable(level, 't2')
 
-        t1_hashes = set(t1_hashtable.keys())
-        t2_hashes = set(t2_hashtable.keys())
-
-        hashes_added = t2_hashes - t1_hashes
-        hashes_removed = t1_hashes - t2_hashes
-
-        items_added = [t2_hashtable[i].item for i in hashes_added]
-        items_removed = [t1_hashtable[i].item for i in hashes_removed]
+        items_added = [v.item for k, v in t2_hashtable.items() if k not in t1_hashtable]
+        items_removed = [v.item for k, v in t1_hashtable.items() if k not in t2_hashtable]
 
         for item in items_added:
             if self._count_diff() is StopIteration:
                 return  # pragma: no cover. This is already covered for addition.
 
-            change_level = level.branch_deeper(
-                notpresent, item, child_relationship_class=SetRelationship)
+            change_level = level.branch_deeper(notpresent, item, SetRelationship)
             self._report_result('set_item_added', change_level, local_tree=local_tree)
 
         for item in items_removed:
             if self._count_diff() is StopIteration:
                 return  # pragma: no cover. This is already covered for addition.
 
-            change_level = level.branch_deeper(
-                item, notpresent, child_relationship_class=SetRelationship)
+            change_level = level.branch_deeper(item, notpresent, SetRelationship)
             self._report_result('set_item_removed', change_level, local_tree=local_tree)
 
     @staticmethod
@@ -681,8 +842,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         except AttributeError:
             return False
 
-    def _diff_iterable(self, level, parents_ids=frozenset(), _original_type=None, local_tree=None):
+    def _diff_iterable(self, level, parents_ids=None, _original_type=None, local_tree=None):
         """Difference of iterables"""
+        if parents_ids is None:
+            parents_ids = set()
         if (self.ignore_order_func and self.ignore_order_func(level)) or self.ignore_order:
             self._diff_iterable_with_deephash(level, parents_ids, _original_type=_original_type, local_tree=local_tree)
         else:
@@ -698,12 +861,24 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         This will compare in sequence order.
         """
         if t1_from_index is None:
+            t1 = level.t1
+            t2 = level.t2
+            if (
+                (type(t1) in _BUILTIN_SEQUENCE_TYPES or isinstance(t1, Sized))
+                and (type(t2) in _BUILTIN_SEQUENCE_TYPES or isinstance(t2, Sized))
+                and len(t1) == len(t2)
+            ):
+                # Nothing needs to be filled in when the lengths are the same.
+                return [((i, i), (x, y)) for i, (x, y) in enumerate(zip(t1, t2))]
             return [((i, i), (x, y)) for i, (x, y) in enumerate(
                 zip_longest(
-                    level.t1, level.t2, fillvalue=ListItemRemovedOrAdded))]
+                    t1, t2, fillvalue=ListItemRemovedOrAdded))]
         else:
             t1_chunk = level.t1[t1_from_index:t1_to_index]
             t2_chunk = level.t2[t2_from_index:t2_to_index]
+            if len(t1_chunk) == len(t2_chunk):
+                return [((i + t1_from_index, i + t2_from_index), (x, y)) for i, (x, y) in enumerate(
+                    zip(t1_chunk, t2_chunk))]
             return [((i + t1_from_index, i + t2_from_index), (x, y)) for i, (x, y) in enumerate(
                 zip_longest(
                     t1_chunk, t2_chunk, fillvalue=ListItemRemovedOrAdded))]
@@ -732,11 +907,11 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             )
         try:
             matches = []
-            y_matched = set()
             y_index_matched = set()
+            t2 = list(level.t2)
             for i, x in enumerate(level.t1):
                 x_found = False
-                for j, y in enumerate(level.t2):
+                for j, y in enumerate(t2):
 
                     if(j in y_index_matched):
                         # This ensures a one-to-one relationship of matches from t1 to t2.
@@ -745,27 +920,15 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                         continue
 
                     if(self.iterable_compare_func(x, y, level)):
-                        deep_hash = DeepHash(y,
-                                             hashes=self.hashes,
-                                             apply_hash=True,
-                                             **self.deephash_parameters,
-                                             )
                         y_index_matched.add(j)
-                        y_matched.add(deep_hash[y])
                         matches.append(((i, j), (x, y)))
                         x_found = True
                         break
 
                 if(not x_found):
                     matches.append(((i, -1), (x, ListItemRemovedOrAdded)))
-            for j, y in enumerate(level.t2):
-
-                deep_hash = DeepHash(y,
-                                     hashes=self.hashes,
-                                     apply_hash=True,
-                                     **self.deephash_parameters,
-                                     )
-                if(deep_hash[y] not in y_matched):
+            for j, y in enumerate(t2):
+                if(j not in y_index_matched):
                     matches.append(((-1, j), (ListItemRemovedOrAdded, y)))
             return matches
         except CannotCompare:
@@ -775,7 +938,9 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 t2_from_index=t2_from_index, t2_to_index=t2_to_index
             )
 
-    def _diff_iterable_in_order(self, level, parents_ids=frozenset(), _original_type=None, local_tree=None):
+    def _diff_iterable_in_order(self, level, parents_ids=None, _original_type=None, local_tree=None):
+        if parents_ids is None:
+            parents_ids = set()
         # We're handling both subscriptable and non-subscriptable iterables. Which one is it?
         subscriptable = self._iterables_subscriptable(level.t1, level.t2)
         if subscriptable:
@@ -785,8 +950,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
 
         if (
             not self.zip_ordered_iterables
-            and isinstance(level.t1, Sequence)
-            and isinstance(level.t2, Sequence)
+            and (type(level.t1) in _BUILTIN_SEQUENCE_TYPES or isinstance(level.t1, Sequence))
+            and (type(level.t2) in _BUILTIN_SEQUENCE_TYPES or isinstance(level.t2, Sequence))
             and self._all_values_basic_hashable(level.t1)
             and self._all_values_basic_hashable(level.t2)
             and self.iterable_compare_func is None
@@ -800,7 +965,7 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 local_tree=local_tree_pass,
             )
             # Sometimes DeepDiff's old iterable diff does a better job than DeepDiff
-            if len(local_tree_pass) > 1:
+            if len(local_tree_pass) > 1 and not self._opcodes_are_in_place_replacements(level, opcodes_with_values):
                 local_tree_pass2 = TreeResult()
                 self._diff_by_forming_pairs_and_comparing_one_by_one(
                     level,
@@ -825,7 +990,32 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 local_tree=local_tree,
             )
 
-    def _all_values_basic_hashable(self, iterable):
+    def _opcodes_are_in_place_replacements(self, level, opcodes_with_values):
+        """
+        Would comparing the items one by one give exactly the same report as the opcodes?
+
+        That is the case when the iterables only have items replaced at the same indexes
+        and the equal items also have the same types. Comparing one by one then reports the same items as the
+        replace opcodes and nothing for the equal items. On a tie DeepDiff uses the report of the
+        one by one comparison so the opcodes should not be kept either.
+        """
+        if self.custom_operators:
+            return False
+        t1 = level.t1
+        t2 = level.t2
+        for opcode in opcodes_with_values:
+            if opcode.t1_from_index != opcode.t2_from_index or opcode.t1_to_index != opcode.t2_to_index:
+                return False
+            if opcode.tag == 'equal':
+                for index in range(opcode.t1_from_index, opcode.t1_to_index):
+                    if type(t1[index]) is not type(t2[index]):
+                        return False
+            elif opcode.tag != 'replace':
+                return False
+        return True
+
+    @staticmethod
+    def _all_values_basic_hashable(iterable):
         """
         Are all items basic hashable types?
         Or there are custom types too?
@@ -834,23 +1024,33 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
     # We don't want to exhaust a generator
         if isinstance(iterable, types.GeneratorType):
             return False
+        if isinstance(iterable, (list, tuple)) and len(iterable) > 16 and isinstance(iterable[0], basic_types):
+            # Long sequences are usually homogeneous. Collecting the distinct types of the items happens in C
+            # and then only those types need to be checked.
+            for type_ in set(map(type, iterable)):
+                if not issubclass(type_, basic_types):
+                    return False
+            return True
         for item in iterable:
             if not isinstance(item, basic_types):
                 return False
         return True
 
     def _diff_by_forming_pairs_and_comparing_one_by_one(
-        self, level, local_tree, parents_ids=frozenset(),
+        self, level, local_tree, parents_ids=None,
         _original_type=None, child_relationship_class=None,
         t1_from_index=None, t1_to_index=None,
         t2_from_index=None, t2_to_index=None,
     ):
+        if parents_ids is None:
+            parents_ids = set()
+        count_diff = self._count_diff
         for (i, j), (x, y) in self._get_matching_pairs(
             level, 
             t1_from_index=t1_from_index, t1_to_index=t1_to_index,
             t2_from_index=t2_from_index, t2_to_index=t2_to_index
         ):
-            if self._count_diff() is StopIteration:
+            if count_diff() is StopIteration:
                 return  # pragma: no cover. This is already covered for addition.
 
             reference_param1 = i
@@ -899,7 +1099,6 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 item_id = id(x)
                 if parents_ids and item_id in parents_ids:
                     continue
-                parents_ids_added = add_to_frozen_set(parents_ids, item_id)
 
                 # Go one level deeper
                 next_level = level.branch_deeper(
@@ -909,13 +1108,19 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                     child_relationship_param=reference_param1,
                     child_relationship_param2=reference_param2
                 )
-                self._diff(next_level, parents_ids_added, local_tree=local_tree)
+                parents_ids.add(item_id)
+                try:
+                    self._diff(next_level, parents_ids, local_tree=local_tree)
+                finally:
+                    parents_ids.discard(item_id)
 
     def _diff_ordered_iterable_by_difflib(
-        self, level, local_tree, parents_ids=frozenset(), _original_type=None, child_relationship_class=None,
+        self, level, local_tree, parents_ids=None, _original_type=None, child_relationship_class=None,
     ):
+        if parents_ids is None:
+            parents_ids = set()
 
-        seq = difflib.SequenceMatcher(isjunk=None, a=level.t1, b=level.t2, autojunk=False)
+        seq = SequenceMatcher(isjunk=None, a=level.t1, b=level.t2, autojunk=False)
 
         opcodes = seq.get_opcodes()
         opcodes_with_values = []
@@ -932,10 +1137,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             # print('{:7}   t1[{}:{}] --> t2[{}:{}] {!r:>8} --> {!r}'.format(
             #     tag, t1_from_index, t1_to_index, t2_from_index, t2_to_index, level.t1[t1_from_index:t1_to_index], level.t2[t2_from_index:t2_to_index]))
 
+            old_values = level.t1[t1_from_index: t1_to_index]
+            new_values = level.t2[t2_from_index: t2_to_index]
             opcodes_with_values.append(Opcode(
-                tag, t1_from_index, t1_to_index, t2_from_index, t2_to_index,
-                old_values = level.t1[t1_from_index: t1_to_index],
-                new_values = level.t2[t2_from_index: t2_to_index],
+                tag, t1_from_index, t1_to_index, t2_from_index, t2_to_index, old_values, new_values,
             ))
 
             if tag == 'replace':
@@ -946,23 +1151,24 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                     t2_from_index=t2_from_index, t2_to_index=t2_to_index,
                 )
             elif tag == 'delete':
-                for index, x in enumerate(level.t1[t1_from_index:t1_to_index]):
+                # The opcode already holds the removed slice so we don't slice t1 again.
+                for index, x in enumerate(old_values, t1_from_index):
                     change_level = level.branch_deeper(
                         x,
                         notpresent,
                         child_relationship_class=child_relationship_class,
-                        child_relationship_param=index + t1_from_index,
-                        child_relationship_param2=index + t1_from_index,
+                        child_relationship_param=index,
+                        child_relationship_param2=index,
                     )
                     self._report_result('iterable_item_removed', change_level, local_tree=local_tree)
             elif tag == 'insert':
-                for index, y in enumerate(level.t2[t2_from_index:t2_to_index]):
+                for index, y in enumerate(new_values, t2_from_index):
                     change_level = level.branch_deeper(
                         notpresent,
                         y,
                         child_relationship_class=child_relationship_class,
-                        child_relationship_param=index + t2_from_index,
-                        child_relationship_param2=index + t2_from_index,
+                        child_relationship_param=index,
+                        child_relationship_param2=index,
                     )
                     self._report_result('iterable_item_added', change_level, local_tree=local_tree)
         return opcodes_with_values
@@ -974,7 +1180,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             level.t1 = level.t1.lower()
             level.t2 = level.t2.lower()
 
-        if type(level.t1) == type(level.t2) and level.t1 == level.t2:  # NOQA
+        # str and bytes never compare equal to each other, so equal values can return before any decoding.
+        if level.t1 == level.t2:
             return
 
         # do we add a diff for convenience?
@@ -1025,7 +1232,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         else:
             self._diff_obj(level, parents_ids, is_namedtuple=True, local_tree=local_tree)
 
-    def _add_hash(self, hashes, item_hash, item, i):
+    @staticmethod
+    def _add_hash(hashes, item_hash, item, i):
         if item_hash in hashes:
             hashes[item_hash].indexes.append(i)
         else:
@@ -1036,9 +1244,11 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         obj = getattr(level, t)
 
         local_hashes = dict_()
+        level_path = level.path()
+        add_hash = self._add_hash
         for (i, item) in enumerate(obj):
             try:
-                parent = "{}[{}]".format(level.path(), i)
+                parent = "{}[{}]".format(level_path, i)
                 # Note: in the DeepDiff we only calculate the hash of items when we have to.
                 # So self.hashes does not include hashes of all objects in t1 and t2.
                 # It only includes the ones needed when comparing iterables.
@@ -1051,12 +1261,12 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                                      **self.deephash_parameters,
                                      )
             except UnicodeDecodeError as err:
-                err.reason = f"Can not produce a hash for {level.path()}: {err.reason}"
+                err.reason = f"Can not produce a hash for {level_path}: {err.reason}"
                 raise
             except Exception as e:  # pragma: no cover
                 logger.error("Can not produce a hash for %s."
                              "Not counting this object.\n %s" %
-                             (level.path(), e))
+                             (level_path, e))
             else:
                 try:
                     item_hash = deep_hash[item]
@@ -1066,35 +1276,39 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                     if item_hash is unprocessed:  # pragma: no cover
                         logger.warning("Item %s was not processed while hashing "
                                        "thus not counting this object." %
-                                       level.path())
+                                       level_path)
                     else:
-                        self._add_hash(hashes=local_hashes, item_hash=item_hash, item=item, i=i)
+                        add_hash(local_hashes, item_hash, item, i)
 
         # Also we hash the iterables themselves too so that we can later create cache keys from those hashes.
+        # Nested iterables are usually already hashed while hashing the items of their parent,
+        # in which case there is nothing left to do.
+        if DeepHash.get_key(self.hashes, key=obj, default=None) is not None:
+            return local_hashes
         try:
             DeepHash(
                 obj,
                 hashes=self.hashes,
-                parent=level.path(),
+                parent=level_path,
                 apply_hash=True,
                 **self.deephash_parameters,
             )
         except Exception as e:  # pragma: no cover
             logger.error("Can not produce a hash for iterable %s. %s" %
-                         (level.path(), e))
+                         (level_path, e))
         return local_hashes
 
     @staticmethod
     def _get_distance_cache_key(added_hash, removed_hash):
         key1, key2 = (added_hash, removed_hash) if added_hash > removed_hash else (removed_hash, added_hash)
+        # Build the whole key as a str and encode it once.
+        # The default hash function produces str hashes so that case is checked first.
+        if isinstance(key1, str):
+            return f'{key1}--{key2}dc'.encode('utf-8')
         if isinstance(key1, int):
             # If the hash function produces integers we convert them to hex values.
             # This was used when the default hash function was Murmur3 128bit which produces integers.
-            key1 = hex(key1).encode('utf-8')
-            key2 = hex(key2).encode('utf-8')
-        elif isinstance(key1, str):
-            key1 = key1.encode('utf-8')
-            key2 = key2.encode('utf-8')
+            return f'{hex(key1)}--{hex(key2)}dc'.encode('utf-8')
         return key1 + b'--' + key2 + b'dc'
 
     def _get_rough_distance_of_hashed_objs(
@@ -1150,14 +1364,13 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             if cache_key in self._distance_cache:
                 return self._distance_cache.get(cache_key).copy()
 
-        # A dictionary of hashes to distances and each distance to an ordered set of hashes.
+        # A dictionary of (distance, hash) to a list of the hashes that are in that distance from the hash.
         # It tells us about the distance of each object from other objects.
-        # And the objects with the same distances are grouped together in an ordered set.
-        # It also includes a "max" key that is just the value of the biggest current distance in the
-        # most_in_common_pairs dictionary.
-        def defaultdict_orderedset():
-            return defaultdict(SetOrdered)
-        most_in_common_pairs = defaultdict(defaultdict_orderedset)
+        # Each hash is added at most once per distance so plain lists work as ordered sets here
+        # and list.pop() gives the same last-in-first-out order as SetOrdered.pop().
+        most_in_common_pairs = {}
+        # A dictionary of each distance to the list of hashes that have other objects in that distance.
+        distances_to_from_hashes = defaultdict(list)
         pairs = dict_()
 
         pre_calced_distances = None
@@ -1174,18 +1387,17 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             pre_calced_distances = self._precalculate_distance_by_custom_compare_func(
                 hashes_added, hashes_removed, t1_hashtable, t2_hashtable, _original_type)
 
+        # Loop is detected for the removed items that are among the parents, so they are not paired.
+        removed_hashes_and_objs = [
+            (removed_hash, t1_hashtable[removed_hash]) for removed_hash in hashes_removed
+            if id(t1_hashtable[removed_hash].item) not in parents_ids
+        ]
         for added_hash in hashes_added:
-            for removed_hash in hashes_removed:
-                added_hash_obj = t2_hashtable[added_hash]
-                removed_hash_obj = t1_hashtable[removed_hash]
-
-                # Loop is detected
-                if id(removed_hash_obj.item) in parents_ids:
-                    continue
-
+            added_hash_obj = t2_hashtable[added_hash]
+            for removed_hash, removed_hash_obj in removed_hashes_and_objs:
                 _distance = None
                 if pre_calced_distances:
-                    _distance = pre_calced_distances.get("{}--{}".format(added_hash, removed_hash))
+                    _distance = pre_calced_distances.get((added_hash, removed_hash))
                 if _distance is None:
                     _distance = self._get_rough_distance_of_hashed_objs(
                         added_hash, removed_hash, added_hash_obj, removed_hash_obj, _original_type)
@@ -1194,22 +1406,27 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 # Discard potential pairs that are too far.
                 if _distance >= self.cutoff_distance_for_pairs:
                     continue
-                pairs_of_item = most_in_common_pairs[added_hash]
-                pairs_of_item[_distance].add(removed_hash)
+                pairs_key = (_distance, added_hash)
+                to_hashes = most_in_common_pairs.get(pairs_key)
+                if to_hashes is None:
+                    most_in_common_pairs[pairs_key] = [removed_hash]
+                    distances_to_from_hashes[_distance].append(added_hash)
+                else:
+                    to_hashes.append(removed_hash)
         used_to_hashes = set()
-
-        distances_to_from_hashes = defaultdict(SetOrdered)
-        for from_hash, distances_to_to_hashes in most_in_common_pairs.items():
-            # del distances_to_to_hashes['max']
-            for dist in distances_to_to_hashes:
-                distances_to_from_hashes[dist].add(from_hash)
+        added_count = len(hashes_added)
+        removed_count = len(removed_hashes_and_objs)
 
         for dist in sorted(distances_to_from_hashes.keys()):
+            # Once all the added or all the removed hashes are used, no more pairs can be made.
+            # The added hashes that are used are the keys of pairs and the rest of the used hashes are removed hashes.
+            if len(pairs) == added_count or len(used_to_hashes) - len(pairs) == removed_count:
+                break
             from_hashes = distances_to_from_hashes[dist]
             while from_hashes:
                 from_hash = from_hashes.pop()
                 if from_hash not in used_to_hashes:
-                    to_hashes = most_in_common_pairs[from_hash][dist]
+                    to_hashes = most_in_common_pairs[(dist, from_hash)]
                     while to_hashes:
                         to_hash = to_hashes.pop()
                         if to_hash not in used_to_hashes:
@@ -1219,8 +1436,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                             # print(f'{bcolors.FAIL}Adding {t2_hashtable[from_hash].item} as a pairs of {t1_hashtable[to_hash].item} with distance of {dist}{bcolors.ENDC}')
                             pairs[from_hash] = to_hash
 
-        inverse_pairs = {v: k for k, v in pairs.items()}
-        pairs.update(inverse_pairs)
+        # The keys and values are copied since pairs can't be iterated over while being updated.
+        pairs.update(zip(list(pairs.values()), list(pairs.keys())))
         if cache_key and self._stats[DISTANCE_CACHE_ENABLED]:
             self._distance_cache.set(cache_key, value=pairs)
         return pairs.copy()
@@ -1230,10 +1447,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
 
         full_t1_hashtable = self._create_hashtable(level, 't1')
         full_t2_hashtable = self._create_hashtable(level, 't2')
-        t1_hashes = SetOrdered(full_t1_hashtable.keys())
-        t2_hashes = SetOrdered(full_t2_hashtable.keys())
-        hashes_added = t2_hashes - t1_hashes
-        hashes_removed = t1_hashes - t2_hashes
+        hashes_added = SetOrdered([k for k in full_t2_hashtable if k not in full_t1_hashtable])
+        hashes_removed = SetOrdered([k for k in full_t1_hashtable if k not in full_t2_hashtable])
 
         # Deciding whether to calculate pairs or not.
         if (len(hashes_added) + len(hashes_removed)) / (len(full_t1_hashtable) + len(full_t2_hashtable) + 1) > self.cutoff_intersection_for_pairs:
@@ -1246,9 +1461,12 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             t1_hashtable = full_t1_hashtable
             t2_hashtable = full_t2_hashtable
         else:
-            t1_hashtable = {k: v for k, v in full_t1_hashtable.items() if k in hashes_removed}
-            t2_hashtable = {k: v for k, v in full_t2_hashtable.items() if k in hashes_added}
-        if self._stats[PASSES_COUNT] < self.max_passes and get_pairs:
+            t1_hashtable = {k: full_t1_hashtable[k] for k in hashes_removed}
+            t2_hashtable = {k: full_t2_hashtable[k] for k in hashes_added}
+        if not hashes_added or not hashes_removed:
+            # There is nothing to pair when one side has no items of its own.
+            pairs = dict_()
+        elif self._stats[PASSES_COUNT] < self.max_passes and get_pairs:
             self._stats[PASSES_COUNT] += 1
             pairs = self._get_most_in_common_pairs_in_iterables(
                 hashes_added, hashes_removed, t1_hashtable, t2_hashtable, parents_ids, _original_type)
@@ -1283,9 +1501,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 other = hashtable[other]
             return other
 
+        count_diff = self._count_diff
         if self.report_repetition:
             for hash_value in hashes_added:
-                if self._count_diff() is StopIteration:
+                if count_diff() is StopIteration:
                     return  # pragma: no cover. This is already covered for addition (when report_repetition=False).
                 other = get_other_pair(hash_value)
                 item_id = id(other.item)
@@ -1308,10 +1527,9 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                     if other.item is notpresent:
                         self._report_result('iterable_item_added', change_level, local_tree=local_tree)
                     else:
-                        parents_ids_added = add_to_frozen_set(parents_ids, item_id)
-                        self._diff(change_level, parents_ids_added, local_tree=local_tree)
+                        self._diff_child_of_parent(change_level, parents_ids, item_id, local_tree=local_tree)
             for hash_value in hashes_removed:
-                if self._count_diff() is StopIteration:
+                if count_diff() is StopIteration:
                     return  # pragma: no cover. This is already covered for addition.
                 other = get_other_pair(hash_value, in_t1=False)
                 item_id = id(other.item)
@@ -1336,27 +1554,26 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                         # I was not able to make a test case for the following 2 lines since the cases end up
                         # getting resolved above in the hashes_added calcs. However I am leaving these 2 lines
                         # in case things change in future.
-                        parents_ids_added = add_to_frozen_set(parents_ids, item_id)  # pragma: no cover.
-                        self._diff(change_level, parents_ids_added, local_tree=local_tree)  # pragma: no cover.
+                        self._diff_child_of_parent(  # pragma: no cover.
+                            change_level, parents_ids, item_id, local_tree=local_tree)
 
-            items_intersect = t2_hashes.intersection(t1_hashes)
-
-            for hash_value in items_intersect:
-                t1_indexes = t1_hashtable[hash_value].indexes
-                t2_indexes = t2_hashtable[hash_value].indexes
-                t1_indexes_len = len(t1_indexes)
-                t2_indexes_len = len(t2_indexes)
-                if t1_indexes_len != t2_indexes_len:  # this is a repetition change!
+            # The items in both t1 and t2 are visited in the order of t2 with one lookup in t1 per item.
+            for hash_value, t2_hashed_item in full_t2_hashtable.items():
+                t1_hashed_item = full_t1_hashtable.get(hash_value)
+                if t1_hashed_item is None:
+                    continue
+                t1_indexes = t1_hashed_item.indexes
+                t2_indexes = t2_hashed_item.indexes
+                if len(t1_indexes) != len(t2_indexes):  # this is a repetition change!
                     # create "change" entry, keep current level untouched to handle further changes
                     repetition_change_level = level.branch_deeper(
-                        t1_hashtable[hash_value].item,
-                        t2_hashtable[hash_value].item,  # nb: those are equal!
+                        t1_hashed_item.item,
+                        t2_hashed_item.item,  # nb: those are equal!
                         child_relationship_class=SubscriptableIterableRelationship,
-                        child_relationship_param=t1_hashtable[hash_value]
-                        .indexes[0])
+                        child_relationship_param=t1_indexes[0])
                     repetition_change_level.additional['repetition'] = RemapDict(
-                        old_repeat=t1_indexes_len,
-                        new_repeat=t2_indexes_len,
+                        old_repeat=len(t1_indexes),
+                        new_repeat=len(t2_indexes),
                         old_indexes=t1_indexes,
                         new_indexes=t2_indexes)
                     self._report_result('repetition_change',
@@ -1364,7 +1581,7 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
 
         else:
             for hash_value in hashes_added:
-                if self._count_diff() is StopIteration:
+                if count_diff() is StopIteration:
                     return
                 other = get_other_pair(hash_value)
                 item_id = id(other.item)
@@ -1380,11 +1597,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 if other.item is notpresent:
                     self._report_result('iterable_item_added', change_level, local_tree=local_tree)
                 else:
-                    parents_ids_added = add_to_frozen_set(parents_ids, item_id)
-                    self._diff(change_level, parents_ids_added, local_tree=local_tree)
+                    self._diff_child_of_parent(change_level, parents_ids, item_id, local_tree=local_tree)
 
             for hash_value in hashes_removed:
-                if self._count_diff() is StopIteration:
+                if count_diff() is StopIteration:
                     return  # pragma: no cover. This is already covered for addition.
                 other = get_other_pair(hash_value, in_t1=False)
                 item_id = id(other.item)
@@ -1402,8 +1618,22 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 else:
                     # Just like the case when report_repetition = True, these lines never run currently.
                     # However they will stay here in case things change in future.
-                    parents_ids_added = add_to_frozen_set(parents_ids, item_id)  # pragma: no cover.
-                    self._diff(change_level, parents_ids_added, local_tree=local_tree)  # pragma: no cover.
+                    self._diff_child_of_parent(  # pragma: no cover.
+                        change_level, parents_ids, item_id, local_tree=local_tree)
+
+    def _diff_child_of_parent(self, level, parents_ids, item_id, local_tree=None):
+        """
+        Diff the level while item_id is among the parents_ids.
+        The parents_ids set is shared by the whole diff so the item_id is removed again afterwards.
+        """
+        if item_id in parents_ids:
+            self._diff(level, parents_ids, local_tree=local_tree)
+            return
+        parents_ids.add(item_id)
+        try:
+            self._diff(level, parents_ids, local_tree=local_tree)
+        finally:
+            parents_ids.discard(item_id)
 
     def _diff_booleans(self, level, local_tree=None):
         if level.t1 != level.t2:
@@ -1435,6 +1665,13 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             # Note that abs(3.25-3.251) = 0.0009999999999998899 < 0.001
             # Note also that "{:.3f}".format(1.1135) = 1.113, but "{:.3f}".format(1.11351) = 1.114
             # For Decimals, format seems to round 2.5 to 2 and 3.5 to 4 (to closest even number)
+            if (
+                self.number_to_string is number_to_string
+                and level.t1.__class__ is level.t2.__class__
+                and level.t1 == level.t2
+            ):
+                # Equal numbers of the same type are converted to the same string by number_to_string.
+                return
             t1_s = self.number_to_string(level.t1,
                                          significant_digits=self.significant_digits,
                                          number_format_notation=self.number_format_notation)
@@ -1450,6 +1687,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
     def _diff_datetimes(self, level, local_tree=None):
         """Diff DateTimes"""
         if self.truncate_datetime:
+            # Equal values with the same tzinfo stay equal once they are truncated and normalized.
+            # Equal values in different timezones may not, since normalizing replaces the tzinfo.
+            if level.t1 == level.t2 and getattr(level.t1, 'tzinfo', None) is getattr(level.t2, 'tzinfo', None):
+                return
             level.t1 = datetime_normalize(self.truncate_datetime, level.t1)
             level.t2 = datetime_normalize(self.truncate_datetime, level.t2)
 
@@ -1461,10 +1702,13 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         if level.t1.int != level.t2.int:
             self._report_result('values_changed', level, local_tree=local_tree)
 
-    def _diff_numpy_array(self, level, parents_ids=frozenset(), local_tree=None):
+    def _diff_numpy_array(self, level, parents_ids=None, local_tree=None):
         """Diff numpy arrays"""
-        if level.path() not in self._numpy_paths:
-            self._numpy_paths[level.path()] = get_type(level.t2).__name__
+        if parents_ids is None:
+            parents_ids = set()
+        level_path = level.path()
+        if level_path not in self._numpy_paths:
+            self._numpy_paths[level_path] = get_type(level.t2).__name__
         if np is None:
             # This line should never be run. If it is ever called means the type check detected a numpy array
             # which means numpy module needs to be available. So np can't be None.
@@ -1472,18 +1716,18 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
 
         if (self.ignore_order_func and not self.ignore_order_func(level)) or not self.ignore_order:
             # fast checks
-            if self.significant_digits is None:
-                if np.array_equal(level.t1, level.t2, equal_nan=self.ignore_nan_inequality):
-                    return  # all good
-            else:
-                try:
-                    np.testing.assert_almost_equal(level.t1, level.t2, decimal=self.significant_digits)
-                except TypeError:
-                    np.array_equal(level.t1, level.t2, equal_nan=self.ignore_nan_inequality)
-                except AssertionError:
-                    pass    # do detailed checking below
-                else:
+            if self._numpy_arrays_are_same_view(level.t1, level.t2):
+                return  # all good
+            # Integer and boolean arrays can't hold NaN and differ by at least 1 when they are not equal,
+            # so they only need an exact comparison unless the significant digits are 0.
+            integers = (
+                level.t1.dtype.kind in NUMPY_INTEGER_DTYPE_KINDS and level.t2.dtype.kind in NUMPY_INTEGER_DTYPE_KINDS
+            )
+            if self.significant_digits is None or (integers and self.significant_digits > 0):
+                if np.array_equal(level.t1, level.t2, equal_nan=self.ignore_nan_inequality and not integers):
                     return  # all good
+            elif self._numpy_arrays_almost_equal(level.t1, level.t2):
+                return  # all good
 
         # compare array meta-data
         _original_type = level.t1.dtype
@@ -1497,8 +1741,19 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             # metadata same -- the difference is in the content
             shape = level.t1.shape
             dimensions = len(shape)
+            only_changed_items = (
+                level.t1.dtype == level.t2.dtype
+                and level.t1.dtype.kind in NUMPY_NUMERIC_DTYPE_KINDS
+                and not self.custom_operators
+                and self.iterable_compare_func is None
+            )
             if dimensions == 1:
-                self._diff_iterable(level, parents_ids, _original_type=_original_type, local_tree=local_tree)
+                if only_changed_items and not (
+                    (self.ignore_order_func and self.ignore_order_func(level)) or self.ignore_order
+                ):
+                    self._diff_numpy_array_changed_items(level, parents_ids, local_tree=local_tree)
+                else:
+                    self._diff_iterable(level, parents_ids, _original_type=_original_type, local_tree=local_tree)
             elif (self.ignore_order_func and self.ignore_order_func(level)) or self.ignore_order:
                 # arrays are converted to python lists so that certain features of DeepDiff can apply on them easier.
                 # They will be converted back to Numpy at their final dimension.
@@ -1506,50 +1761,157 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 level.t2 = level.t2.tolist()
                 self._diff_iterable_with_deephash(level, parents_ids, _original_type=_original_type, local_tree=local_tree)
             else:
-                for (t1_path, t1_row), (t2_path, t2_row) in zip(
-                        get_numpy_ndarray_rows(level.t1, shape),
-                        get_numpy_ndarray_rows(level.t2, shape)):
+                # Both arrays have the same shape so the rows of t2 are at the same paths as the rows of t1.
+                t2 = level.t2
+                # Rows with no changed items are found in one vectorized comparison and are not diffed.
+                # Their items are still counted as diffs of their pairs and of the items themselves,
+                # the same as diffing the row item by item, so that the stats and max_diffs are not affected.
+                changed_rows = (level.t1 != t2).any(axis=-1) if only_changed_items else None
+                row_diff_count = 2 * shape[-1]
+                for row_path, t1_row in get_numpy_ndarray_rows(level.t1, shape):
+                    if changed_rows is not None and not changed_rows[row_path]:
+                        if self._count_diffs(row_diff_count) is StopIteration:
+                            return
+                        continue
 
                     new_level = level.branch_deeper(
                         t1_row,
-                        t2_row,
+                        t2[row_path],
                         child_relationship_class=NumpyArrayRelationship,
-                        child_relationship_param=t1_path,
-                        child_relationship_param2=t2_path,
+                        child_relationship_param=row_path,
+                        child_relationship_param2=row_path,
                     )
 
                     self._diff_iterable_in_order(new_level, parents_ids, _original_type=_original_type, local_tree=local_tree)
 
+    def _numpy_arrays_almost_equal(self, t1, t2):
+        """
+        Are the 2 arrays equal up to the significant digits?
+        This has the same outcome as np.testing.assert_almost_equal.
+        """
+        decimal = self.significant_digits
+        if (
+            t1.shape == t2.shape
+            and t1.dtype.kind in NUMPY_NUMERIC_DTYPE_KINDS
+            and t2.dtype.kind in NUMPY_NUMERIC_DTYPE_KINDS
+            and np.isfinite(t1).all()
+            and np.isfinite(t2).all()
+        ):
+            # Without NaN and inf, assert_almost_equal only checks abs(desired-actual) < 1.5 * 10**(-decimal).
+            # Doing that directly avoids raising and formatting an AssertionError when the arrays are different.
+            t2 = t2.astype(np.result_type(t2, 1.0), copy=False)
+            return bool((np.abs(t1 - t2) < 1.5 * 10.0 ** (-decimal)).all())
+        try:
+            np.testing.assert_almost_equal(t1, t2, decimal=decimal)
+        except TypeError:
+            return np.array_equal(t1, t2, equal_nan=self.ignore_nan_inequality)
+        except AssertionError:
+            return False
+        return True
+
+    def _numpy_arrays_are_same_view(self, t1, t2):
+        """
+        Are the 2 arrays views of the exact same memory with the same layout?
+        Then they are equal without comparing their items, unless they can have items that are not equal to
+        themselves such as NaN and those are not ignored.
+        """
+        if t1.shape != t2.shape or t1.dtype != t2.dtype or t1.strides != t2.strides:
+            return False
+        kind = t1.dtype.kind
+        if kind not in NUMPY_SELF_EQUAL_DTYPE_KINDS and not (self.ignore_nan_inequality and kind in 'fc'):
+            return False
+        return t1.__array_interface__['data'][0] == t2.__array_interface__['data'][0]
+
+    def _diff_numpy_array_changed_items(self, level, parents_ids=None, local_tree=None):
+        """
+        Diff 2 one dimensional numeric numpy arrays of the same shape and dtype.
+        The items are compared in one vectorized operation and only the ones that are not equal are diffed further.
+        The equal items are still counted as diffs of their pair and of the item itself, the same as
+        diffing the arrays item by item, so that the stats and max_diffs are not affected.
+        """
+        if parents_ids is None:
+            parents_ids = set()
+        t1 = level.t1
+        t2 = level.t2
+        count_diff = self._count_diff
+        count_diffs = self._count_diffs
+        previous_index = -1
+        for index in np.flatnonzero(t1 != t2).tolist():
+            if count_diffs(2 * (index - previous_index - 1)) is StopIteration:
+                return
+            previous_index = index
+            if count_diff() is StopIteration:
+                return
+
+            next_level = level.branch_deeper(
+                t1[index],
+                t2[index],
+                child_relationship_class=SubscriptableIterableRelationship,
+                child_relationship_param=index,
+                child_relationship_param2=index,
+            )
+            self._diff(next_level, parents_ids, local_tree=local_tree)
+        count_diffs(2 * (len(t1) - previous_index - 1))
+
     def _diff_types(self, level, local_tree=None):
         """Diff types"""
         level.report_type = 'type_changes'
         self._report_result('type_changes', level, local_tree=local_tree)
 
     def _count_diff(self):
-        if (self.max_diffs is not None and self._stats[DIFF_COUNT] > self.max_diffs):
-            if not self._stats[MAX_DIFF_LIMIT_REACHED]:
-                self._stats[MAX_DIFF_LIMIT_REACHED] = True
+        # The stats are shared by all the passes and the progress logger so the count stays in the stats.
+        stats = self._stats
+        diff_count = stats[DIFF_COUNT]
+        if (self.max_diffs is not None and diff_count > self.max_diffs):
+            if not stats[MAX_DIFF_LIMIT_REACHED]:
+                stats[MAX_DIFF_LIMIT_REACHED] = True
                 logger.warning(MAX_DIFFS_REACHED_MSG.format(self.max_diffs))
             return StopIteration
-        self._stats[DIFF_COUNT] += 1
-        if self.cache_size and self.cache_tuning_sample_size:
+        stats[DIFF_COUNT] = diff_count + 1
+        if self._auto_tune_cache_enabled:
             self._auto_tune_cache()
 
+    def _count_diffs(self, count):
+        """
+        Count the diffs of items that are known to be equal without diffing them.
+        The stats come out the same as calling _count_diff count times.
+        Returns StopIteration if max_diffs is reached.
+        """
+        if not count:
+            return
+        if self._auto_tune_cache_enabled:
+            # The cache is tuned based on samples taken while counting so the diffs are counted one by one.
+            count_diff = self._count_diff
+            for _ in range(count):
+                if count_diff() is StopIteration:
+                    return StopIteration
+            return
+        stats = self._stats
+        if self.max_diffs is None or stats[DIFF_COUNT] + count <= self.max_diffs + 1:
+            stats[DIFF_COUNT] += count
+            return
+        # _count_diff stops counting once the count is over max_diffs.
+        stats[DIFF_COUNT] = self.max_diffs + 1
+        return self._count_diff()
+
     def _auto_tune_cache(self):
-        take_sample = (self._stats[DIFF_COUNT] % self.cache_tuning_sample_size == 0)
+        # This runs for every diff so the stats and the diff count are only looked up once.
+        stats = self._stats
+        diff_count = stats[DIFF_COUNT]
+        take_sample = (diff_count % self.cache_tuning_sample_size == 0)
         if self.cache_tuning_sample_size:
-            if self._stats[DISTANCE_CACHE_ENABLED]:
+            if stats[DISTANCE_CACHE_ENABLED]:
                 if take_sample:
                     self._auto_off_cache()
             # Turn on the cache once in a while
-            elif self._stats[DIFF_COUNT] % self._shared_parameters[_ENABLE_CACHE_EVERY_X_DIFF] == 0:
+            elif diff_count % self._shared_parameters[_ENABLE_CACHE_EVERY_X_DIFF] == 0:
                 self.progress_logger('Re-enabling the distance and level caches.')
                 # decreasing the sampling frequency
                 self._shared_parameters[_ENABLE_CACHE_EVERY_X_DIFF] *= 10
-                self._stats[DISTANCE_CACHE_ENABLED] = True
+                stats[DISTANCE_CACHE_ENABLED] = True
         if take_sample:
-            for key in (PREVIOUS_DIFF_COUNT, PREVIOUS_DISTANCE_CACHE_HIT_COUNT):
-                self._stats[key] = self._stats[key[9:]]
+            stats[PREVIOUS_DIFF_COUNT] = diff_count
+            stats[PREVIOUS_DISTANCE_CACHE_HIT_COUNT] = stats[DISTANCE_CACHE_HIT_COUNT]
 
     def _auto_off_cache(self):
         """
@@ -1570,16 +1932,55 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         In that case the report will appear in the final results of this diff.
         Otherwise basically the 2 objects in the level are being omitted from the results.
         """
+        if not self.custom_operators:
+            return False
 
-        for operator in self.custom_operators:
-            if operator.match(level):
+        if level.t1.__class__ is type(level.t1) and level.t2.__class__ is type(level.t2):
+            types_key = (type(level.t1), type(level.t2))
+            operators = self._custom_operators_cache.get(types_key)
+            if operators is None:
+                operators = self._custom_operators_cache[types_key] = self._get_custom_operators_for_types(level)
+        else:
+            # isinstance also checks the class that an object pretends to be, so nothing is cached for them.
+            operators = [(operator, True) for operator in self.custom_operators]
+
+        for operator, needs_match in operators:
+            if not needs_match or operator.match(level):
                 prevent_default = operator.give_up_diffing(level=level, diff_instance=self)
                 if prevent_default:
                     return True
 
         return False
 
-    def _diff(self, level, parents_ids=frozenset(), _original_type=None, local_tree=None):
+    def _get_custom_operators_for_types(self, level):
+        """
+        Get the custom operators to check for levels with the same types of t1 and t2 as this level.
+        A BaseOperator that only matches by types is matched once here, as long as its types are classes
+        whose isinstance checks only depend on the class of the object.
+        Any other operator is returned with needs_match so that it is matched for every level.
+        That includes operators with types such as runtime checkable Protocols and ABCs.
+        """
+        operators = []
+        for operator in self.custom_operators:
+            if (
+                isinstance(operator, BaseOperator)
+                and type(operator).match is BaseOperator.match
+                and not operator.regex_paths
+                and all(isinstance_depends_on_class_only(type_) for type_ in operator.types or ())
+            ):
+                if operator.match(level):
+                    operators.append((operator, False))
+            else:
+                operators.append((operator, True))
+        return operators
+
+    def _is_type_change_not_in_type_groups(self, level):
+        for type_group in self.ignore_type_in_groups:
+            if self.type_check_func(level.t1, type_group) and self.type_check_func(level.t2, type_group):
+                return False
+        return True
+
+    def _diff(self, level, parents_ids=None, _original_type=None, local_tree=None):
         """
         The main diff method
 
@@ -1589,6 +1990,8 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
         parents_ids: the ids of all the parent objects in the tree from the current node.
         _original_type: If the objects had an original type that was different than what currently exists in the level.t1 and t2
         """
+        if parents_ids is None:
+            parents_ids = set()
         if self._count_diff() is StopIteration:
             return
 
@@ -1602,11 +2005,30 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             return
 
         report_type_change = True
-        if get_type(level.t1) != get_type(level.t2):
-            for type_group in self.ignore_type_in_groups:
-                if self.type_check_func(level.t1, type_group) and self.type_check_func(level.t2, type_group):
-                    report_type_change = False
-                    break
+        t1_class = type(level.t1)
+        # Objects of the same class have the same type unless they are classes or numpy arrays,
+        # so get_type is only needed for those or when the classes are different.
+        if t1_class is not type(level.t2) or t1_class is type or isinstance(level.t1, np_ndarray):
+            t1_type = get_type(level.t1)
+            t2_type = get_type(level.t2)
+        else:
+            t1_type = t2_type = t1_class
+        if t1_type != t2_type:
+            if self.ignore_type_in_groups:
+                if (
+                    not self._type_group_cache_enabled
+                    or isinstance(level.t1, type) or isinstance(level.t2, type)
+                    or level.t1.__class__ is not type(level.t1) or level.t2.__class__ is not type(level.t2)
+                ):
+                    # The type check of classes depends on the class itself and not only on its type.
+                    # The type check of objects that pretend to be of another class depends on their __class__.
+                    report_type_change = self._is_type_change_not_in_type_groups(level)
+                else:
+                    type_group_key = (type(level.t1), t1_type, type(level.t2), t2_type)
+                    report_type_change = self._type_group_cache.get(type_group_key)
+                    if report_type_change is None:
+                        report_type_change = self._is_type_change_not_in_type_groups(level)
+                        self._type_group_cache[type_group_key] = report_type_change
             if self.use_enum_value and isinstance(level.t1, Enum):
                 level.t1 = level.t1.value
                 report_type_change = False
@@ -1621,47 +2043,68 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
                 self._report_result('values_changed', level, local_tree=local_tree)
                 return
 
-        if self.ignore_nan_inequality and isinstance(level.t1, (float, np_floating)) and str(level.t1) == str(level.t2) == 'nan':
+        # A float is NaN when it is not equal to itself so no str conversion is needed unless t1 is NaN.
+        if (
+            self.ignore_nan_inequality
+            and isinstance(level.t1, (float, np_floating))
+            and level.t1 != level.t1
+            and str(level.t2) == 'nan'
+        ):
             return
 
-        if isinstance(level.t1, booleans):
-            self._diff_booleans(level, local_tree=local_tree)
-
-        elif isinstance(level.t1, strings):
-            self._diff_str(level, local_tree=local_tree)
-
-        elif isinstance(level.t1, datetimes):
-            self._diff_datetimes(level, local_tree=local_tree)
-
-        elif isinstance(level.t1, uuids):
-            self._diff_uuids(level, local_tree=local_tree)
+        # The isinstance checks that pick the diff method only depend on the class of the object,
+        # unless the object pretends to be of another class.
+        t1_class = type(level.t1)
+        if level.t1.__class__ is t1_class:
+            try:
+                method_name = self._diff_method_cache[t1_class]
+            except KeyError:
+                method_name = self._diff_method_cache[t1_class] = self._get_diff_method_name(level.t1)
+        else:
+            method_name = self._get_diff_method_name(level.t1)
 
-        elif isinstance(level.t1, numbers):
+        if method_name == '_diff_numbers':
             self._diff_numbers(level, local_tree=local_tree, report_type_change=report_type_change)
-
-        elif isinstance(level.t1, Mapping):
-            self._diff_dict(level, parents_ids, local_tree=local_tree)
-
-        elif isinstance(level.t1, tuple):
-            self._diff_tuple(level, parents_ids, local_tree=local_tree)
-
-        elif isinstance(level.t1, (set, frozenset, SetOrdered)):
-            self._diff_set(level, local_tree=local_tree)
-
-        elif isinstance(level.t1, np_ndarray):
-            self._diff_numpy_array(level, parents_ids, local_tree=local_tree)
-
-        elif isinstance(level.t1, PydanticBaseModel):
-            self._diff_obj(level, parents_ids, local_tree=local_tree)
-
-        elif isinstance(level.t1, Iterable):
+        elif method_name in _DIFF_METHODS_WITHOUT_PARENTS_IDS:
+            getattr(self, method_name)(level, local_tree=local_tree)
+        elif method_name == '_diff_iterable':
             self._diff_iterable(level, parents_ids, _original_type=_original_type, local_tree=local_tree)
-
-        elif isinstance(level.t1, Enum):
-            self._diff_enum(level, parents_ids, local_tree=local_tree)
-
-        else:
+        elif method_name is None:
             self._diff_obj(level, parents_ids)
+        else:
+            getattr(self, method_name)(level, parents_ids, local_tree=local_tree)
+
+    @staticmethod
+    def _get_diff_method_name(obj):
+        """
+        Get the name of the method that diffs the object based on its type.
+        None means the object is diffed as a generic object.
+        """
+        if isinstance(obj, booleans):
+            return '_diff_booleans'
+        if isinstance(obj, strings):
+            return '_diff_str'
+        if isinstance(obj, datetimes):
+            return '_diff_datetimes'
+        if isinstance(obj, uuids):
+            return '_diff_uuids'
+        if isinstance(obj, numbers):
+            return '_diff_numbers'
+        if isinstance(obj, Mapping):
+            return '_diff_dict'
+        if isinstance(obj, tuple):
+            return '_diff_tuple'
+        if isinstance(obj, (set, frozenset, SetOrdered)):
+            return '_diff_set'
+        if isinstance(obj, np_ndarray):
+            return '_diff_numpy_array'
+        if isinstance(obj, PydanticBaseModel):
+            return '_diff_obj'
+        if isinstance(obj, Iterable):
+            return '_diff_iterable'
+        if isinstance(obj, Enum):
+            return '_diff_enum'
+        return None
 
     def _get_view_results(self, view):
         """
@@ -1703,9 +2146,10 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             group_by_level1 = group_by
         if isinstance(item, Iterable) and not isinstance(item, Mapping):
             result = {}
-            item_copy = deepcopy(item)
-            for row in item_copy:
+            for row in item:
                 if isinstance(row, Mapping):
+                    # Only the group_by keys are popped from the row so a shallow copy keeps the item intact.
+                    row = copy(row)
                     key1 = self._get_key_for_group_by(row, group_by_level1, item_name)
                     if group_by_level2:
                         key2 = self._get_key_for_group_by(row, group_by_level2, item_name)
@@ -1772,15 +2216,14 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             SetOrdered([3, 4, 5, 6, 2])
 
         """
-        result = SetOrdered()
+        # The set is built once from all the paths instead of making a new set for every report key.
+        paths = []
         for key in REPORT_KEYS:
             value = self.get(key)
             if value:
-                if isinstance(value, SetOrdered):
-                    result |= value
-                else:
-                    result |= SetOrdered(value.keys())
-        return result
+                # Iterating over a dictionary of the results gives its paths.
+                paths.extend(value)
+        return SetOrdered(paths)
 
     @property
     def affected_root_keys(self):
@@ -1803,15 +2246,12 @@ class DeepDiff(ResultDict, SerializationMixin, DistanceMixin, Base):
             >>> ddiff.affected_root_keys
             SetOrdered([3, 4, 5, 6, 2])
         """
-        result = SetOrdered()
+        root_keys = []
         for key in REPORT_KEYS:
             value = self.tree.get(key)
             if value:
-                if isinstance(value, SetOrdered):
-                    result |= SetOrdered([i.get_root_key() for i in value])
-                else:
-                    result |= SetOrdered([i.get_root_key() for i in value.keys()])
-        return result
+                root_keys.extend([i.get_root_key() for i in value])
+        return SetOrdered(root_keys)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -91,7 +91,7 @@ class DistanceMixin:
                         distance = self.math_epsilon or 0.000001
                     else:
                         distance = 1
-                    pre_calced_distances["{}--{}".format(added_hash, removed_hash)] = distance
+                    pre_calced_distances[(added_hash, removed_hash)] = distance
 
         return pre_calced_distances
 
@@ -131,7 +131,7 @@ class DistanceMixin:
         i = 0
         for added_hash in hashes_added:
             for removed_hash in hashes_removed:
-                pre_calced_distances["{}--{}".format(added_hash, removed_hash)] = distances[i]
+                pre_calced_distances[(added_hash, removed_hash)] = distances[i]
                 i += 1
         return pre_calced_distances
 
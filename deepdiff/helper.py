@@ -12,7 +12,7 @@ import enum
 from typing import NamedTuple, Any, List, Optional
 from ast import literal_eval
 from decimal import Decimal, localcontext, InvalidOperation as InvalidDecimalOperation
-from itertools import repeat
+from itertools import repeat, product
 # from orderly_set import OrderlySet as SetOrderedBase  # median: 0.806 s, some tests are failing
 # from orderly_set import SetOrdered as SetOrderedBase  # median 1.011 s, didn't work for tests
 from orderly_set import StableSetEq as SetOrderedBase  # median: 1.0867 s for cache test, 5.63s for all tests
@@ -356,6 +356,30 @@ def convert_item_or_items_into_compiled_regexes_else_none(items):
     return items
 
 
+# Backreferences and conditional groups refer to groups by number or name and
+# can not be safely combined with other patterns into one regex.
+_REGEX_GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+
+def compile_regexes_union(regexes):
+    """
+    Combine a list of compiled regexes into one compiled regex that matches when any of them does.
+    Returns None if the regexes can not be combined, for example when they have different flags.
+    """
+    if not regexes:
+        return None
+    flags = regexes[0].flags
+    for regex in regexes:
+        if regex.flags != flags or not isinstance(regex.pattern, str):
+            return None
+        if _REGEX_GROUP_REFERENCE.search(regex.pattern):
+            return None
+    try:
+        return re.compile('|'.join('(?:{})'.format(regex.pattern) for regex in regexes), flags)
+    except re.error:
+        return None
+
+
 def get_id(obj):
     """
     Adding some characters to id so they are not just integers to reduce the risk of collision.
@@ -376,6 +400,15 @@ def numpy_dtype_string_to_type(dtype_str):
     return numpy_dtype_str_to_type[dtype_str]
 
 
+def isinstance_depends_on_class_only(type_):
+    """
+    Whether isinstance(obj, type_) only depends on the class of obj, as long as obj does not pretend to be
+    of another class. That is not the case when the metaclass of type_ customizes __instancecheck__,
+    such as ABCs and runtime checkable Protocols whose checks can depend on the object itself.
+    """
+    return isinstance(type_, type) and type(type_).__instancecheck__ is type.__instancecheck__
+
+
 def type_in_type_group(item, type_group):
     return get_type(item) in type_group
 
@@ -508,11 +541,9 @@ def get_numpy_ndarray_rows(obj, shape=None):
         shape = obj.shape
 
     dimentions = shape[:-1]
-    for path_tuple in cartesian_product_of_shape(dimentions):
-        result = obj
-        for index in path_tuple:
-            result = result[index]
-        yield path_tuple, result
+    # Indexing with the whole path tuple gets the row view in one step.
+    for path_tuple in product(*map(range, dimentions)):
+        yield path_tuple, obj[path_tuple]
 
 
 class _NotFound:
@@ -685,11 +716,38 @@ def get_homogeneous_numpy_compatible_type_of_seq(seq):
         return False
 
 
-def detailed__dict__(obj, ignore_private_variables=True, ignore_keys=frozenset(), include_keys=None):
+def dir_depends_on_class_only(obj):
+    """
+    Whether dir(obj) is made of the keys of obj.__dict__ and the names that come from the class of obj.
+    That is not the case for classes, objects that customize dir() and objects that pretend to be of another class.
+    """
+    cls = type(obj)
+    return not (isinstance(obj, type) or cls.__dir__ is not object.__dir__ or obj.__class__ is not cls)
+
+
+def get_class_level_dir(obj, dir_cache=None):
+    """
+    Get the names from dir(obj) that are not necessarily in obj.__dict__.
+    For regular instances these are the names that come from the class, so they are cached per class
+    in dir_cache when it is passed.
+    The names of a class change when attributes are set on the class, so dir_cache should only be
+    kept for as long as the classes are not changed.
+    """
+    if dir_cache is None or not dir_depends_on_class_only(obj):
+        return dir(obj)
+    cls = type(obj)
+    result = dir_cache.get(cls)
+    if result is None:
+        result = dir_cache[cls] = tuple(dir(cls))
+    return result
+
+
+def detailed__dict__(obj, ignore_private_variables=True, ignore_keys=frozenset(), include_keys=None, dir_cache=None):
     """
     Get the detailed dictionary of an object.
 
     This is used so we retrieve object properties too.
+    dir_cache: An optional dictionary to cache the names that come from the class of the object.
     """
     if include_keys:
         result = {}
@@ -709,7 +767,8 @@ def detailed__dict__(obj, ignore_private_variables=True, ignore_keys=frozenset()
                 ignore_private_variables and key.startswith('__') and not key.startswith(private_var_prefix)
             ):
                 del result[key]
-        for key in dir(obj):
+        # The keys of obj.__dict__ are already in the result, so only the rest of dir(obj) needs to be checked.
+        for key in get_class_level_dir(obj, dir_cache):
             if key not in result and key not in ignore_keys and (
                     not ignore_private_variables or (
                         ignore_private_variables and not key.startswith('__') and not key.startswith(private_var_prefix)
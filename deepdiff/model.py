@@ -82,10 +82,10 @@ class TreeResult(ResultDict):
         if 'iterable_item_added' in self and not self['iterable_item_added']:
             del self['iterable_item_added']
 
-    def __getitem__(self, item):
-        if item not in self:
-            self[item] = SetOrdered()
-        return self.get(item)
+    def __missing__(self, item):
+        # Only called by dict.__getitem__ for keys that are not there yet, so existing keys are looked up in C.
+        result = self[item] = SetOrdered()
+        return result
 
     def __len__(self):
         return sum([len(i) for i in self.values() if isinstance(i, SetOrdered)])
@@ -688,8 +688,7 @@ class DiffLevel:
                               string representation of the path or 'list' to produce a list of keys and attributes
                               that produce the path.
         """
-        # TODO: We could optimize this by building on top of self.up's path if it is cached there
-        cache_key = "{}{}{}{}".format(force, get_parent_too, use_t2, output_format)
+        cache_key = (force, get_parent_too, use_t2, output_format)
         if cache_key in self._path:
             cached = self._path[cache_key]
             if get_parent_too:
@@ -698,6 +697,24 @@ class DiffLevel:
             else:
                 return self._format_result(root, cached)
 
+        # If the path of the level above is already cached, we only need to add the last step to it.
+        up = self.up
+        if output_format == 'str' and up is not None:
+            up_path = up._path.get((force, False, use_t2, output_format))
+            if up_path is not None:
+                if use_t2:
+                    next_rel = up.t2_child_rel or up.t1_child_rel
+                else:
+                    next_rel = up.t1_child_rel or up.t2_child_rel
+                item = None if next_rel is None else next_rel.get_param_repr(force)
+                if item:
+                    result = up_path + item
+                    if get_parent_too:
+                        self._path[cache_key] = (up_path, next_rel.param, result)
+                        return (self._format_result(root, up_path), next_rel.param, self._format_result(root, result))
+                    self._path[cache_key] = result
+                    return self._format_result(root, result)
+
         if output_format == 'str':
             result = parent = param = ""
         else:
@@ -823,6 +840,9 @@ class ChildRelationship:
     "child" object.
     """
 
+    # A relationship object is created for every child of every level, so they don't get a __dict__.
+    __slots__ = ('parent', 'child', 'param')
+
     # Format to a be used for representing param.
     # E.g. for a dict, this turns a formatted param param "42" into "[42]".
     param_repr_format = None
@@ -919,29 +939,32 @@ class ChildRelationship:
 
 
 class DictRelationship(ChildRelationship):
+    __slots__ = ()
     param_repr_format = "[{}]"
     quote_str = "'{}'"
 
 
 class NumpyArrayRelationship(ChildRelationship):
+    __slots__ = ()
     param_repr_format = "[{}]"
     quote_str = None
 
 
 class SubscriptableIterableRelationship(DictRelationship):
-    pass
+    __slots__ = ()
 
 
 class InaccessibleRelationship(ChildRelationship):
-    pass
+    __slots__ = ()
 
 
 # there is no random access to set elements
 class SetRelationship(InaccessibleRelationship):
-    pass
+    __slots__ = ()
 
 
 class NonSubscriptableIterableRelationship(InaccessibleRelationship):
+    __slots__ = ()
 
     param_repr_format = "[{}]"
 
@@ -957,4 +980,5 @@ class NonSubscriptableIterableRelationship(InaccessibleRelationship):
 
 
 class AttributeRelationship(ChildRelationship):
+    __slots__ = ()
     param_repr_format = ".{}"
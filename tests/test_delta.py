@@ -2004,6 +2004,16 @@ class TestDeltaCompareFunc:
         recreated_t2 = t1 + delta
         assert t2 == recreated_t2
 
+    def test_compare_func_with_identical_duplicates_added(self):
+        t1 = [{'id': 1, 'val': 1}]
+        t2 = [{'id': 1, 'val': 1}, {'id': 1, 'val': 1}]
+        ddiff = DeepDiff(t1, t2, iterable_compare_func=self.compare_func, verbose_level=2)
+        expected = {'iterable_item_added': {'root[1]': {'id': 1, 'val': 1}}}
+        assert expected == ddiff
+        delta = Delta(ddiff)
+        recreated_t2 = t1 + delta
+        assert t2 == recreated_t2
+
     def test_compare_func_swap(self):
         t1 = [{'id': 1, 'val': 1}, {'id': 1, 'val': 3}]
         t2 = [{'id': 1, 'val': 3}, {'id': 1, 'val': 1}]
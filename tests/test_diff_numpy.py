@@ -8,6 +8,9 @@ These are numpy specific test cases.
 There are more numpy tests for delta additions in the test_delta.py
 """
 
+_numpy_shared_ints = np.arange(20)
+_numpy_shared_floats = np.array([1.0, np.nan, 3.0])
+
 NUMPY_CASES = {
     'numpy_bools': {
         't1': np.array([True, False, True, False], dtype=bool),
@@ -30,6 +33,12 @@ NUMPY_CASES = {
                             {'root[0][0][2]': {'new_value': 5, 'old_value': 3},
                              'root[0][1][0]': {'new_value': 3, 'old_value': 4}}},
     },
+    'numpy_multi_dimensional_few_changed_rows': {
+        't1': np.arange(12).reshape(2, 3, 2),
+        't2': np.array([[[0, 1], [2, 3], [4, 5]], [[6, 7], [8, 10], [10, 11]]]),
+        'deepdiff_kwargs': {},
+        'expected_result': {'values_changed': {'root[1][1][1]': {'new_value': 10, 'old_value': 9}}},
+    },
     'numpy_array2_type_change': {
         't1': np.array([1, 2, 3], np.int8),
         't2': np.array([1, 2, 5], np.int32),
@@ -125,6 +134,50 @@ NUMPY_CASES = {
         'deepdiff_kwargs': {'significant_digits': 6},
         'expected_result': {},
     },
+    'numpy_almost_equal_with_nan': {
+        't1': np.array([1.0, np.nan, 2.3333333333333]),
+        't2': np.array([1.0, np.nan, 2.33333334]),
+        'deepdiff_kwargs': {'significant_digits': 3, 'ignore_nan_inequality': True},
+        'expected_result': {},
+    },
+    'numpy_not_almost_equal': {
+        't1': np.array([[1.0, 2.3333333]]),
+        't2': np.array([[1.0, 2.3433333]]),
+        'deepdiff_kwargs': {'significant_digits': 3},
+        'expected_result': {'values_changed': {'root[0][1]': {'new_value': 2.3433333, 'old_value': 2.3333333}}},
+    },
+    'numpy_int_arrays_significant_digits': {
+        't1': np.array([1, 2, 3]),
+        't2': np.array([1, 2, 4]),
+        'deepdiff_kwargs': {'significant_digits': 2, 'ignore_nan_inequality': True},
+        'expected_result': {'values_changed': {'root[2]': {'new_value': 4, 'old_value': 3}}},
+    },
+    'numpy_array_large_few_changes': {
+        't1': np.arange(1000, dtype=np.int64),
+        't2': np.where(np.arange(1000) % 400 == 7, -1, np.arange(1000)),
+        'deepdiff_kwargs': {},
+        'expected_result': {'values_changed': {'root[7]': {'new_value': -1, 'old_value': 7},
+                                               'root[407]': {'new_value': -1, 'old_value': 407},
+                                               'root[807]': {'new_value': -1, 'old_value': 807}}},
+    },
+    'numpy_array_floats_with_nan_ignore_nan_inequality': {
+        't1': np.array([1.0, np.nan, 3.0]),
+        't2': np.array([1.0, np.nan, 3.5]),
+        'deepdiff_kwargs': {'ignore_nan_inequality': True},
+        'expected_result': {'values_changed': {'root[2]': {'new_value': 3.5, 'old_value': 3.0}}},
+    },
+    'numpy_array_views_of_same_data': {
+        't1': _numpy_shared_ints[::2],
+        't2': _numpy_shared_ints[::2],
+        'deepdiff_kwargs': {},
+        'expected_result': {},
+    },
+    'numpy_array_views_of_same_data_with_nan_ignore_nan_inequality': {
+        't1': _numpy_shared_floats[:],
+        't2': _numpy_shared_floats[:],
+        'deepdiff_kwargs': {'ignore_nan_inequality': True},
+        'expected_result': {},
+    },
     'numpy_different_shape': {
         't1': np.array([[1, 1], [2, 3]]),
         't2': np.array([1]),
@@ -155,3 +208,32 @@ class TestNumpy:
     def test_numpy(self, test_name, t1, t2, deepdiff_kwargs, expected_result):
         diff = DeepDiff(t1, t2, **deepdiff_kwargs)
         assert expected_result == diff, f"test_numpy {test_name} failed."
+
+    @pytest.mark.parametrize('max_diffs, expected_count, expected_changed', [
+        (None, 21, ['root[3]', 'root[8]']),
+        (30, 21, ['root[3]', 'root[8]']),
+        (8, 9, ['root[3]']),
+        (3, 4, []),
+    ])
+    def test_numpy_array_diff_count_and_max_diffs(self, max_diffs, expected_count, expected_changed):
+        t1 = np.arange(10)
+        t2 = t1.copy()
+        t2[[3, 8]] += 100
+        diff = DeepDiff(t1, t2, max_diffs=max_diffs)
+        # The items that are equal are counted the same as when they are diffed one by one.
+        assert expected_count == diff.get_stats()['DIFF COUNT']
+        assert expected_changed == list(diff.get('values_changed', {}))
+
+    @pytest.mark.parametrize('max_diffs, expected_count, expected_changed', [
+        (None, 25, ['root[2][1]']),
+        (20, 21, ['root[2][1]']),
+        (19, 20, []),
+    ])
+    def test_multi_dimensional_numpy_array_diff_count_and_max_diffs(self, max_diffs, expected_count, expected_changed):
+        t1 = np.arange(12).reshape(3, 4)
+        t2 = t1.copy()
+        t2[2, 1] = 99
+        diff = DeepDiff(t1, t2, max_diffs=max_diffs)
+        # The items of the rows that are equal are counted the same as when they are diffed one by one.
+        assert expected_count == diff.get_stats()['DIFF COUNT']
+        assert expected_changed == list(diff.get('values_changed', {}))
@@ -1,9 +1,12 @@
+import gc
 import pytest
 import datetime
+import weakref
 from time import sleep
 from unittest import mock
 from functools import partial
 from collections import namedtuple
+from collections.abc import Mapping
 from deepdiff import DeepHash
 from deepdiff.helper import pypy3
 from deepdiff.model import DiffLevel
@@ -70,6 +73,90 @@ class TestDiffOther:
         res = DeepDiff(d1, d2, truncate_datetime='second')
         assert res['values_changed']["root['a']"]['new_value'] == 80139
 
+    def test_truncate_datetime_equal_values(self):
+        d1 = {'a': datetime.datetime(2020, 5, 17, 22, 15, 34, 913070)}
+        d2 = {'a': datetime.datetime(2020, 5, 17, 22, 15, 34, 913070)}
+        assert DeepDiff(d1, d2, truncate_datetime='second') == {}
+
+        # Equal in different timezones but not once the timezone is normalized.
+        d1 = {'a': datetime.datetime(2020, 5, 17, 22, 15, tzinfo=datetime.timezone.utc)}
+        d2 = {'a': datetime.datetime(2020, 5, 17, 23, 15, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))}
+        assert d1 == d2
+        res = DeepDiff(d1, d2, truncate_datetime='second')
+        expected = datetime.datetime(2020, 5, 17, 23, 15, tzinfo=datetime.timezone.utc)
+        assert res['values_changed']["root['a']"]['new_value'] == expected
+
+    def test_class_registered_with_abc_after_diff(self):
+
+        class M:
+            def __init__(self, data):
+                self.data = data
+
+            def __getitem__(self, key):
+                return self.data[key]
+
+            def __iter__(self):
+                return iter(self.data)
+
+            def __len__(self):
+                return len(self.data)
+
+            def keys(self):
+                return self.data.keys()
+
+        assert {} == DeepDiff(M({'x': 1}), M({'x': 1}))
+        Mapping.register(M)
+        expected = {'values_changed': {"root['x']": {'new_value': 2, 'old_value': 1}}}
+        assert expected == DeepDiff(M({'x': 1}), M({'x': 2}))
+
+    def test_class_attribute_set_after_diff(self):
+
+        class A:
+            def __init__(self, x):
+                self.x = x
+
+        a = A(1)
+        b = A(1)
+        assert {} == DeepDiff(a, b)
+        A.cls_attr = 1
+        b.cls_attr = 2
+        expected = {'values_changed': {'root.cls_attr': {'new_value': 2, 'old_value': 1}}}
+        assert expected == DeepDiff(a, b)
+
+    def test_diff_without_parents_ids(self):
+
+        class DiffWithoutParentsIds(DeepDiff):
+
+            def _diff_iterable(self, level, parents_ids=None, _original_type=None, local_tree=None):
+                self._diff_iterable_in_order(level, local_tree=local_tree)
+
+        diff = DiffWithoutParentsIds({'a': [1, {'b': 1}]}, {'a': [1, {'b': 2}]}, view='tree')
+        assert ["root['a'][1]['b']"] == [level.path() for level in diff['values_changed']]
+
+    def test_slotted_class_is_not_retained_after_diff(self):
+
+        def diff_throwaway_class():
+            class Slotted:
+                __slots__ = ('x', '__y')
+
+                def __init__(self, x):
+                    self.x = x
+                    self.__y = x
+
+            result = DeepDiff(Slotted(1), Slotted(2))
+            assert {'root.x'} == set(result['values_changed'])
+            return weakref.ref(Slotted)
+
+        class_ref = diff_throwaway_class()
+        gc.collect()
+        assert class_ref() is None
+
+    def test_derived_parameter_caches_are_removed_after_diff(self):
+        diff = DeepDiff({'a': [1]}, {'a': [2]})
+        for key in ('_type_group_cache', '_custom_operators_cache', '_diff_method_cache',
+                    '_class_dir_cache', '_class_slots_cache'):
+            assert not hasattr(diff, key)
+
     def test_invalid_verbose_level(self):
         with pytest.raises(ValueError) as excinfo:
             DeepDiff(1, 2, verbose_level=5)
@@ -6,7 +6,7 @@ import re
 import uuid
 from enum import Enum
 from dataclasses import dataclass
-from typing import List
+from typing import List, Protocol, runtime_checkable
 from decimal import Decimal
 from deepdiff import DeepDiff
 from deepdiff.helper import pypy3, PydanticBaseModel
@@ -503,6 +503,27 @@ class TestDeepDiffText:
         result = {'iterable_item_added': {'root[2]': 'c'}, 'iterable_item_removed': {'root[5]': 'g'}}
         assert result == ddiff
 
+    def test_list_difference_in_place_replacements(self):
+        t1 = [1, 2, 3, 4, 5, 6]
+        t2 = [1, 20, 3, 4, 50, 60]
+        ddiff = DeepDiff(t1, t2)
+        result = {'values_changed': {
+            'root[1]': {'new_value': 20, 'old_value': 2},
+            'root[4]': {'new_value': 50, 'old_value': 5},
+            'root[5]': {'new_value': 60, 'old_value': 6}}}
+        assert result == ddiff
+        assert not ddiff._iterable_opcodes
+
+        # 1.0 and 1 are equal so difflib does not report them but the one by one comparison does.
+        t1 = [1.0, 2, 3, 4]
+        t2 = [1, 20, 30, 4]
+        ddiff = DeepDiff(t1, t2)
+        result = {'values_changed': {
+            'root[1]': {'new_value': 20, 'old_value': 2},
+            'root[2]': {'new_value': 30, 'old_value': 3}}}
+        assert result == ddiff
+        assert ddiff._iterable_opcodes
+
     def test_list_difference_with_tiny_variations(self):
         t1 = ['a', 'b', 'c', 'd']
         t2 = ['f', 'b', 'a', 'g']
@@ -1435,6 +1456,26 @@ class TestDeepDiffText:
         diff = DeepDiff(float('0.1'), Decimal('0.1'), ignore_type_in_groups=[(float, Decimal)], significant_digits=2)
         assert not diff
 
+    def test_ignore_type_in_groups_with_instance_dependent_isinstance(self):
+
+        @runtime_checkable
+        class HasSpecial(Protocol):
+            special: int
+
+        class Box:
+            def __init__(self, special=None):
+                if special is not None:
+                    self.special = special
+
+        class Crate(Box):
+            pass
+
+        t1 = [Box(special=1), Box()]
+        t2 = [Crate(special=1), Crate()]
+        ddiff = DeepDiff(t1, t2, ignore_type_in_groups=[(HasSpecial, )])
+        # Only the objects that have the special attribute belong to the HasSpecial type group.
+        assert {'root[1]'} == set(ddiff['type_changes'])
+
     @pytest.mark.parametrize("t1, t2, significant_digits, result", [
         ([0.1], [Decimal('0.10')], 55,
             {'values_changed': {'root[0]': {'new_value': Decimal('0.10'), 'old_value': 0.1}}}),  # Due to floating point arithmetics with high significant digits.
@@ -1985,6 +2026,22 @@ class TestDeepDiffText:
         }
         assert expected == diff
 
+    def test_group_by_does_not_change_the_items(self):
+        t1 = [
+            {'id': 'AA', 'name': 'Joe', 'phones': ['111']},
+            {'id': 'BB', 'name': 'James', 'phones': ['222']},
+        ]
+        t2 = [
+            {'id': 'AA', 'name': 'Joe', 'phones': ['111', '333']},
+            {'id': 'BB', 'name': 'James', 'phones': ['222']},
+        ]
+
+        diff = DeepDiff(t1, t2, group_by='id')
+        expected = {'iterable_item_added': {"root['AA']['phones'][1]": '333'}}
+        assert expected == diff
+        assert {'id': 'AA', 'name': 'Joe', 'phones': ['111']} == t1[0]
+        assert {'id': 'AA', 'name': 'Joe', 'phones': ['111', '333']} == t2[0]
+
     def test_group_by_not_list_of_dicts(self):
         t1 = {1: 2}
 
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import re
 import pytest
 import datetime
 import numpy as np
@@ -10,7 +11,7 @@ from deepdiff.helper import (
     not_found, diff_numpy_array, cartesian_product_numpy,
     get_truncate_datetime, datetime_normalize,
     detailed__dict__, ENUM_INCLUDE_KEYS, add_root_to_paths,
-    get_semvar_as_integer,
+    get_semvar_as_integer, compile_regexes_union,
 )
 
 
@@ -301,3 +302,17 @@ class TestHelper:
     def test_get_semvar_as_integer(self, test_num, value, expected):
         result = get_semvar_as_integer(value)
         assert expected == result, f"test_get_semvar_as_integer #{test_num} failed."
+
+    @pytest.mark.parametrize('test_num, patterns, path, is_combined, expected', [
+        (1, [r"\['a'\]", r"\[\d+\]$"], "root['a']", True, True),
+        (2, [r"\['a'\]", r"\[\d+\]$"], "root['b'][3]", True, True),
+        (3, [r"\['a'\]", r"\[\d+\]$"], "root['b']", True, False),
+        (4, [r"(x)\1"], "root['xx']", False, None),
+        (5, [re.compile('a', re.I), re.compile('b')], "root['A']", False, None),
+    ])
+    def test_compile_regexes_union(self, test_num, patterns, path, is_combined, expected):
+        regexes = [re.compile(i) if isinstance(i, str) else i for i in patterns]
+        result = compile_regexes_union(regexes)
+        assert is_combined is (result is not None), f"test_compile_regexes_union #{test_num} failed."
+        if is_combined:
+            assert expected is bool(result.search(path)), f"test_compile_regexes_union #{test_num} failed."
@@ -156,6 +156,12 @@ class TestDiffLevel:
         assert self.lowest.path("root") == "root[1337].a"
         assert self.lowest.path("") == "[1337].a"
 
+    def test_path_built_on_cached_up_path(self):
+        assert self.intermediate.path() == "root[1337]"
+        assert self.lowest.path() == "root[1337].a"
+        assert self.lowest.path(get_parent_too=True) == ("root[1337]", "a", "root[1337].a")
+        assert self.lowest.path(use_t2=True) == "root[1337].a"
+
     def test_path_when_both_children_empty(self):
         """
         This is a situation that should never happen.
@@ -1,6 +1,6 @@
 import math
 
-from typing import List
+from typing import List, Protocol, runtime_checkable
 from deepdiff import DeepDiff
 from deepdiff.operator import BaseOperator, PrefixOrSuffixOperator
 
@@ -277,3 +277,60 @@ class TestOperators:
 
         result3 = DeepDiff(x, y, custom_operators=operators, zip_ordered_iterables=True)
         assert {} == result3, "We should get the same result as result2 when zip_ordered_iterables is True."
+
+    def test_base_operator_types_and_regex_paths(self):
+
+        class ExpectChange(BaseOperator):
+
+            def give_up_diffing(self, level, diff_instance):
+                diff_instance.custom_report_result('diff', level, {'path': level.path()})
+                return True
+
+        t1 = {'a': 1, 'b': 'x', 'c': [1.5, 'y'], 'd': 2}
+        t2 = {'a': 2, 'b': 'z', 'c': [2.5, 'w'], 'd': 3}
+
+        ddiff = DeepDiff(t1, t2, custom_operators=[
+            ExpectChange(types=[float]),
+            ExpectChange(regex_paths=[r"\['d'\]"]),
+        ])
+
+        expected = {
+            'values_changed': {
+                "root['a']": {'new_value': 2, 'old_value': 1},
+                "root['b']": {'new_value': 'z', 'old_value': 'x'},
+                "root['c'][1]": {'new_value': 'w', 'old_value': 'y'},
+            },
+            'diff': {
+                "root['c'][0]": {'path': "root['c'][0]"},
+                "root['d']": {'path': "root['d']"},
+            },
+        }
+        assert expected == ddiff
+
+    def test_base_operator_types_with_instance_dependent_isinstance(self):
+
+        @runtime_checkable
+        class HasSpecial(Protocol):
+            special: int
+
+        class Box:
+            def __init__(self, **kwargs):
+                self.__dict__.update(kwargs)
+
+        class ExpectChange(BaseOperator):
+
+            def give_up_diffing(self, level, diff_instance):
+                diff_instance.custom_report_result('diff', level, {'path': level.path()})
+                return True
+
+        # Both items are Boxes but only the second one is a HasSpecial.
+        t1 = [Box(x=1), Box(special=1)]
+        t2 = [Box(x=2), Box(special=2)]
+
+        ddiff = DeepDiff(t1, t2, custom_operators=[ExpectChange(types=[HasSpecial])])
+
+        expected = {
+            'values_changed': {'root[0].x': {'new_value': 2, 'old_value': 1}},
+            'diff': {'root[1]': {'path': 'root[1]'}},
+        }
+        assert expected == ddiff